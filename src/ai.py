@@ -7,82 +7,348 @@ Implémente un algorithme simple pour déterminer le meilleur placement d'une pi
 """
 
 import copy
+import json
 import random
+import time
+from src.pieces import ROTATION_COUNTS
+from src.transposition import TranspositionTable
+from src.movegen import MoveGenerator
+
+# Score attribué à une position où la pièce suivante ne peut plus être placée
+GAME_OVER_SCORE = -1e6
+
+# Paramètres d'évaluation des positions par défaut
+DEFAULT_WEIGHTS = {
+    'height': -0.510066,  # Hauteur cumulée 
+    'lines': 0.760666,    # Lignes complètes
+    'holes': -0.35663,    # Nombre de trous
+    'bumpiness': -0.184483 # Irrégularité du terrain
+}
+
+def load_weights(path):
+    """Charge des paramètres d'évaluation depuis un fichier JSON
+    
+    Args:
+        path: Chemin du fichier (un objet avec les clés de DEFAULT_WEIGHTS)
+    
+    Returns:
+        dict: Paramètres d'évaluation
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    
+    # Accepte aussi les points de reprise du réglage automatique
+    data = data.get("best_weights", data)
+    
+    missing = set(DEFAULT_WEIGHTS) - set(data)
+    if missing:
+        raise ValueError(f"Paramètres manquants dans {path} : {', '.join(sorted(missing))}")
+    return {name: float(data[name]) for name in DEFAULT_WEIGHTS}
 
 class AI:
     """Intelligence artificielle simple pour le jeu Tetris"""
     
-    def __init__(self, board):
+    def __init__(self, board, use_numpy=False, search_depth=2, beam_width=4, time_budget=0.1,
+                 cache_size=200000, reachable_moves=False, weights=None):
         """Initialise l'IA avec un plateau de jeu
         
         Args:
             board: Plateau de jeu de l'IA
+            use_numpy: Si True, évalue tous les placements d'un coup avec NumPy
+            search_depth: Nombre de pièces connues prises en compte (1 = coup par coup)
+            beam_width: Nombre de placements explorés plus en profondeur à chaque niveau
+            time_budget: Temps de recherche maximal par coup, en secondes
+            cache_size: Nombre maximal d'entrées de la table de transposition
+            reachable_moves: Si True, ne considère que les placements atteignables depuis
+                             la position d'apparition (glissements et rotations compris)
+            weights: Paramètres d'évaluation (par défaut, DEFAULT_WEIGHTS)
         """
         self.board = board
         
+        # Paramètres de la recherche avec anticipation
+        self.search_depth = search_depth
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        
+        # Table de transposition : évaluations et résultats de recherche
+        # indexés par le hash de Zobrist du plateau
+        self.cache = TranspositionTable(cache_size)
+        
         # Paramètres d'évaluation des positions
-        self.weights = {
-            'height': -0.510066,  # Hauteur cumulée 
-            'lines': 0.760666,    # Lignes complètes
-            'holes': -0.35663,    # Nombre de trous
-            'bumpiness': -0.184483 # Irrégularité du terrain
-        }
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        
+        # Générateur des placements atteignables (sinon, chutes droites depuis le haut)
+        self.move_generator = MoveGenerator() if reachable_moves else None
+        
+        # Évaluateur vectorisé optionnel (nécessite NumPy)
+        self.batch_evaluator = None
+        if use_numpy:
+            from src.batch_eval import BatchEvaluator
+            self.batch_evaluator = BatchEvaluator()
     
-    def get_best_move(self, piece):
+    def get_best_move(self, piece, next_pieces=None, deadline=None):
         """Détermine le meilleur placement pour une pièce
         
+        Si les pièces suivantes sont connues, les placements les plus prometteurs
+        sont explorés en profondeur (jusqu'à search_depth pièces) et jugés sur la
+        position obtenue après les pièces suivantes. La recherche est interruptible :
+        à l'échéance, le meilleur placement trouvé jusque-là est retourné.
+        
         Args:
             piece: Pièce à placer
+            next_pieces: Pièces suivantes connues (optionnel)
+            deadline: Échéance (time.perf_counter) de la recherche
+                      (par défaut, maintenant + time_budget)
             
         Returns:
-            dict: Dictionnaire contenant la position x et la rotation optimales
+            dict: Dictionnaire contenant la position x, la ligne d'arrivée y et la rotation
+                  optimales (et les mouvements pour y parvenir si reachable_moves est actif)
                   ou None si aucun placement valide n'est trouvé
         """
         if not piece:
             return None
         
-        best_score = float('-inf')
-        best_move = None
+        placements = self.generate_placements(piece)
+        scores = self.score_placements(piece, placements)
+        
+        # Pièces prises en compte par la recherche avec anticipation
+        pieces = [piece] + [p for p in (next_pieces or []) if p][:self.search_depth - 1]
+        if len(pieces) > 1 and placements:
+            if deadline is None:
+                deadline = time.perf_counter() + self.time_budget
+            searched = self._search_root(pieces, placements, scores, deadline)
+            if searched:
+                placements, scores = searched
+        
+        move = self.select_move(placements, scores)
+        
+        # Joint les mouvements qui mènent au placement choisi
+        if move and self.move_generator:
+            move["path"] = self.move_generator.get_path(
+                self.board, piece, move["rotation"], move["x"], move["y"]
+            )
+        
+        return move
+    
+    def _search_root(self, pieces, placements, scores, deadline):
+        """Explore en profondeur les meilleurs placements de la première pièce
+        
+        Args:
+            pieces: Pièce à placer suivie des pièces suivantes
+            placements: Placements (rotation, x, y) de la première pièce
+            scores: Scores immédiats de ces placements (utilisés pour l'élagage)
+            deadline: Instant (time.perf_counter) où la recherche doit s'arrêter
+        
+        Returns:
+            tuple: (placements explorés, scores après anticipation)
+                   ou None si le temps est écoulé avant la fin du premier placement
+        """
+        searched_placements = []
+        searched_scores = []
+        
+        test_piece = copy.copy(pieces[0])
+        for index in self._best_indexes(scores):
+            if time.perf_counter() > deadline:
+                break
+            
+            test_piece.rotation, test_piece.x, test_piece.y = placements[index]
+            self.board.make_move(test_piece)
+            score, _ = self._search(pieces, 1, deadline)
+            self.board.unmake_move()
+            searched_scores.append(score)
+            searched_placements.append(placements[index])
+        
+        if not searched_placements:
+            return None
+        return searched_placements, searched_scores
+    
+    def _search(self, pieces, level, deadline):
+        """Évalue la position courante en anticipant les pièces suivantes
+        
+        Les placements de chaque niveau sont élagués avec l'évaluation immédiate :
+        seuls les beam_width meilleurs sont explorés au niveau suivant. Le plateau
+        est modifié puis restauré en place à chaque branche, et les résultats des
+        recherches complètes sont mémorisés dans la table de transposition.
+        
+        Args:
+            pieces: Liste des pièces à placer successivement
+            level: Indice de la pièce à placer
+            deadline: Instant (time.perf_counter) où la recherche doit s'arrêter
+        
+        Returns:
+            tuple: (meilleur score atteignable, True si la recherche est complète)
+        """
+        key = (self.board.hash, self.beam_width) + tuple(p.type for p in pieces[level:])
+        cached_score = self.cache.get(key)
+        if cached_score is not None:
+            return cached_score, True
+        
+        piece = pieces[level]
+        placements = self.generate_placements(piece)
+        if not placements:
+            return GAME_OVER_SCORE, True
+        
+        scores = self.score_placements(piece, placements)
+        if level == len(pieces) - 1:
+            best_score = max(scores)
+            self.cache.put(key, best_score)
+            return best_score, True
+        
+        best_score = None
+        complete = True
+        test_piece = copy.copy(piece)
+        for index in self._best_indexes(scores):
+            # Temps écoulé : on se contente de ce qui a déjà été exploré
+            if best_score is not None and time.perf_counter() > deadline:
+                complete = False
+                break
+            
+            test_piece.rotation, test_piece.x, test_piece.y = placements[index]
+            self.board.make_move(test_piece)
+            score, branch_complete = self._search(pieces, level + 1, deadline)
+            self.board.unmake_move()
+            
+            complete = complete and branch_complete
+            if best_score is None or score > best_score:
+                best_score = score
+        
+        # Un résultat tronqué par le temps n'est pas réutilisable
+        if complete:
+            self.cache.put(key, best_score)
+        return best_score, complete
+    
+    def _best_indexes(self, scores):
+        """Retourne les indices des beam_width meilleurs scores
+        
+        Args:
+            scores: Liste de scores
+        
+        Returns:
+            list: Indices triés du meilleur au moins bon score
+        """
+        return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:self.beam_width]
+    
+    def score_placements(self, piece, placements):
+        """Évalue les placements d'une pièce avec l'évaluateur configuré
+        
+        Args:
+            piece: Pièce à placer
+            placements: Placements (rotation, x, y) à évaluer
+        
+        Returns:
+            list: Score de chaque placement
+        """
+        # Évalue tous les placements, en une seule passe vectorisée si possible
+        if self.batch_evaluator:
+            return self.batch_evaluator.evaluate(self.board, piece, placements, self.weights)
+        return self.evaluate_placements(piece, placements)
+    
+    def generate_placements(self, piece):
+        """Énumère les placements possibles d'une pièce
+        
+        Sans reachable_moves, la pièce est lâchée tout droit depuis le haut
+        dans chaque rotation et chaque colonne où elle tient.
+        
+        Args:
+            piece: Pièce à placer
         
-        # Essaie toutes les rotations possibles
-        for rotation in range(4):  # Maximum 4 rotations
-            test_piece = copy.deepcopy(piece)
+        Returns:
+            list: Placements (rotation, x, y) valides
+        """
+        if self.move_generator:
+            return [
+                (placement.rotation, placement.x, placement.y)
+                for placement in self.move_generator.generate(self.board, piece)
+            ]
+        
+        placements = []
+        
+        # Une seule copie légère de la pièce pour les calculs de position
+        test_piece = copy.copy(piece)
+        
+        # Essaie toutes les rotations distinctes de la pièce
+        for rotation in range(ROTATION_COUNTS[piece.type]):
             test_piece.rotation = rotation
             
-            # Pour chaque rotation, essaie toutes les positions x possibles
-            for x in range(-2, self.board.width + 2):
-                test_piece = copy.deepcopy(piece)
-                test_piece.rotation = rotation
-                test_piece.x = x
-                
-                # Fait tomber la pièce jusqu'à ce qu'elle ne puisse plus descendre
-                test_piece.y = 0
-                while self.board.is_valid_position(test_piece):
-                    test_piece.y += 1
-                
-                # Remonte d'une case pour obtenir la dernière position valide
-                test_piece.y -= 1
+            # Pour chaque rotation, essaie les positions x où la pièce tient
+            for x in self.board.get_legal_x_range(piece.type, rotation):
+                # Calcule directement la ligne où la pièce s'arrête
+                y = self.board.get_landing_y(test_piece, x)
                 
                 # Vérifie si le placement est valide
-                if test_piece.y >= 0 and self.board.is_valid_position(test_piece):
-                    # Simule l'ajout de la pièce au plateau et évalue la position
-                    test_board = copy.deepcopy(self.board)
-                    test_board.add_piece(test_piece)
-                    
-                    # Évalue la position
-                    score = self.evaluate_position(test_board)
-                    
-                    # Met à jour le meilleur mouvement si nécessaire
-                    if score > best_score:
-                        best_score = score
-                        best_move = {"x": x, "rotation": rotation}
-                        
-                        # Ajoute un peu d'aléatoire pour éviter les mouvements trop prévisibles
-                        if random.random() < 0.1:  # 10% de chance de choisir une position différente
-                            best_score = score + random.uniform(-0.1, 0.1)
+                if y >= 0:
+                    placements.append((rotation, x, y))
+        
+        return placements
+    
+    def evaluate_placements(self, piece, placements):
+        """Évalue chaque placement d'une pièce, l'un après l'autre
+        
+        Le plateau est modifié puis restauré en place (make_move / unmake_move)
+        au lieu d'être copié.
+        
+        Args:
+            piece: Pièce à placer
+            placements: Placements (rotation, x, y) à évaluer
+        
+        Returns:
+            list: Score de chaque placement
+        """
+        scores = []
+        test_piece = copy.copy(piece)
+        
+        for rotation, x, y in placements:
+            test_piece.rotation = rotation
+            test_piece.x = x
+            test_piece.y = y
+            
+            # Joue le coup sur le plateau, évalue la position puis l'annule.
+            # Une position déjà rencontrée est lue dans la table de transposition
+            self.board.make_move(test_piece)
+            score = self.cache.get(self.board.hash)
+            if score is None:
+                score = self.evaluate_position(self.board)
+                self.cache.put(self.board.hash, score)
+            self.board.unmake_move()
+            
+            scores.append(score)
+        
+        return scores
+    
+    def select_move(self, placements, scores):
+        """Choisit le meilleur placement à partir des scores
+        
+        Args:
+            placements: Placements (rotation, x, y) évalués
+            scores: Score de chaque placement
+        
+        Returns:
+            dict: Dictionnaire contenant la position x, la ligne d'arrivée y et la rotation
+                  optimales ou None si aucun placement n'est fourni
+        """
+        best_score = float('-inf')
+        best_move = None
+        
+        for (rotation, x, y), score in zip(placements, scores):
+            # Met à jour le meilleur mouvement si nécessaire
+            if score > best_score:
+                best_score = score
+                best_move = {"x": x, "y": y, "rotation": rotation}
+                
+                # Ajoute un peu d'aléatoire pour éviter les mouvements trop prévisibles
+                if random.random() < 0.1:  # 10% de chance de choisir une position différente
+                    best_score = score + random.uniform(-0.1, 0.1)
         
         return best_move
     
+    def get_cache_stats(self):
+        """Retourne les statistiques de la table de transposition
+        
+        Returns:
+            dict: Taille, succès, échecs, évictions et taux de succès
+        """
+        return self.cache.get_stats()
+    
     def evaluate_position(self, board):
         """Évalue une position de jeu
         
@@ -98,7 +364,7 @@ class AI:
         
         # Calcule les métriques d'évaluation
         aggregate_height = sum(heights)
-        complete_lines = sum(1 for y in range(board.height) if all(board.grid[y]))
+        complete_lines = board.get_complete_lines_count()
         bumpiness = sum(abs(heights[i] - heights[i+1]) for i in range(len(heights)-1))
         
         # Calcule le score d'évaluation
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Exécution des décisions de l'IA hors du thread de l'interface
+Les demandes et les résultats transitent par des files thread-safe
+"""
+
+import copy
+import queue
+import threading
+import time
+from src.profiler import profiler
+
+class AIWorker:
+    """Thread de calcul qui exécute les décisions de l'IA en arrière-plan"""
+    
+    def __init__(self, ai):
+        """Démarre le thread de calcul
+        
+        Args:
+            ai: Instance de l'IA utilisée pour les décisions
+        """
+        self.ai = ai
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        
+        self.thread = threading.Thread(target=self._run, name="ai-worker", daemon=True)
+        self.thread.start()
+    
+    def submit(self, request_id, board, piece, next_pieces=None):
+        """Demande une décision à l'IA
+        
+        Le plateau et les pièces sont copiés : le jeu peut continuer à les
+        modifier pendant la recherche. L'échéance de la recherche est fixée
+        dès maintenant, le temps d'attente dans la file est donc compté.
+        
+        Args:
+            request_id: Identifiant de la demande, renvoyé avec le résultat
+            board: Plateau de l'IA
+            piece: Pièce à placer
+            next_pieces: Pièces suivantes connues (optionnel)
+        """
+        deadline = time.perf_counter() + self.ai.time_budget
+        self.requests.put((
+            request_id,
+            board.copy(),
+            copy.copy(piece),
+            [copy.copy(p) for p in (next_pieces or []) if p],
+            deadline,
+        ))
+    
+    def poll(self):
+        """Retourne un résultat disponible, sans attendre
+        
+        Returns:
+            tuple: (identifiant de la demande, coup choisi, durée de la décision en s)
+                   ou None si aucun résultat n'est disponible
+        """
+        try:
+            return self.results.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def stop(self):
+        """Arrête le thread de calcul après la demande en cours"""
+        self.requests.put(None)
+    
+    def _run(self):
+        """Boucle du thread : traite les demandes une par une"""
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            
+            request_id, board, piece, next_pieces, deadline = request
+            
+            # L'IA travaille sur la copie du plateau
+            ai = self.ai
+            ai.board = board
+            start = time.perf_counter()
+            with profiler.timed("ai.get_best_move"):
+                move = ai.get_best_move(piece, next_pieces, deadline=deadline)
+            self.results.put((request_id, move, time.perf_counter() - start))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Évaluation vectorisée des placements pour l'IA (optionnelle, nécessite NumPy)
+Construit en une fois les plateaux résultant de tous les placements candidats
+et calcule leurs métriques avec des opérations NumPy
+"""
+
+from src.pieces import ROTATIONS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+def numpy_available():
+    """Indique si NumPy est installé
+    
+    Returns:
+        bool: True si l'évaluation vectorisée est disponible
+    """
+    return np is not None
+
+class BatchEvaluator:
+    """Évalue tous les placements d'une pièce en une seule passe vectorisée"""
+    
+    def __init__(self):
+        """Initialise l'évaluateur
+        
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if np is None:
+            raise ImportError("L'évaluation vectorisée de l'IA nécessite NumPy (pip install numpy)")
+    
+    def evaluate(self, board, piece, placements, weights):
+        """Évalue une liste de placements
+        
+        Donne les mêmes scores que AI.evaluate_position appliquée au plateau
+        obtenu après chaque placement (lignes complètes effacées).
+        
+        Args:
+            board: Plateau de départ
+            piece: Pièce à placer
+            placements: Placements (rotation, x, y) à évaluer
+            weights: Poids d'évaluation de l'IA
+        
+        Returns:
+            list: Score de chaque placement
+        """
+        if not placements:
+            return []
+        
+        count = len(placements)
+        height, width = board.height, board.width
+        
+        # Plateau de départ en booléens, décodé depuis les masques de lignes
+        base = (np.array(board.rows, dtype=np.int64)[:, None] >> np.arange(width)) & 1
+        grids = np.repeat(base.astype(bool)[None], count, axis=0)
+        
+        # Pose la pièce sur chaque plateau candidat
+        board_ids, ys, xs = [], [], []
+        for index, (rotation, x, y) in enumerate(placements):
+            for x_offset, y_offset in ROTATIONS[(piece.type, rotation)].cells:
+                board_ids.append(index)
+                ys.append(y + y_offset)
+                xs.append(x + x_offset)
+        grids[board_ids, ys, xs] = True
+        
+        # Efface les lignes complètes : tri stable qui place les lignes pleines
+        # en haut (dans l'ordre), puis vidage de ces lignes
+        full = grids.all(axis=2)
+        lines_cleared = full.sum(axis=1)
+        order = np.argsort(~full, axis=1, kind="stable")
+        grids = np.take_along_axis(grids, order[:, :, None], axis=1)
+        grids[np.arange(height)[None, :] < lines_cleared[:, None]] = False
+        
+        # Hauteur de chaque colonne à partir de la première cellule occupée
+        occupied_columns = grids.any(axis=1)
+        heights = np.where(occupied_columns, height - grids.argmax(axis=1), 0)
+        
+        # Trous : cellules vides sous une cellule occupée de la même colonne
+        covered = np.logical_or.accumulate(grids, axis=1)
+        holes = (covered & ~grids).sum(axis=(1, 2))
+        
+        aggregate_height = heights.sum(axis=1)
+        complete_lines = grids.all(axis=2).sum(axis=1)
+        bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+        
+        scores = (
+            weights['height'] * aggregate_height +
+            weights['lines'] * complete_lines +
+            weights['holes'] * holes +
+            weights['bumpiness'] * bumpiness
+        )
+        
+        return scores.tolist()
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Microbenchmarks des fonctions critiques du plateau, de l'IA et de l'affichage
+Mesure le débit (opérations/s) sur des plateaux de test générés à partir d'une
+graine, le compare à une référence enregistrée en JSON et échoue en cas de
+régression supérieure au seuil choisi
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Ajouter le répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.board import Board
+from src.pieces import get_random_piece, PieceType, PIECE_COLORS, ROTATION_COUNTS
+from src.ai import AI
+
+# Fichier de référence par défaut (à la racine du projet)
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmark_baseline.json"
+)
+
+# Interface cachée partagée par les benchmarks d'affichage
+_hidden_ui = None
+
+class BenchmarkSkipped(Exception):
+    """Levée quand un benchmark ne peut pas s'exécuter dans l'environnement courant"""
+
+def drop_random_piece(board, rng):
+    """Lâche une pièce aléatoire à une position aléatoire
+    
+    Args:
+        board: Plateau de jeu
+        rng: Générateur aléatoire
+    
+    Returns:
+        bool: False si la pièce ne tient plus sur le plateau
+    """
+    piece = get_random_piece(rng=rng)
+    piece.rotation = rng.randrange(ROTATION_COUNTS[piece.type])
+    piece.x = rng.choice(board.get_legal_x_range(piece.type, piece.rotation))
+    piece.y = board.get_landing_y(piece)
+    if piece.y < 0:
+        return False
+    
+    board.add_piece(piece)
+    return True
+
+def make_board(seed, pieces, height=20):
+    """Construit un plateau de test en lâchant des pièces aléatoires
+    
+    Args:
+        seed: Graine du plateau
+        pieces: Nombre de pièces lâchées
+        height: Hauteur du plateau
+    
+    Returns:
+        Board: Plateau de test
+    """
+    rng = random.Random(seed)
+    board = Board(width=10, height=height)
+    for _ in range(pieces):
+        if not drop_random_piece(board, rng):
+            break
+    return board
+
+def make_full_rows_board(seed, pieces):
+    """Construit un plateau de test dont les deux lignes du bas sont complètes
+    
+    Args:
+        seed: Graine du plateau
+        pieces: Nombre de pièces lâchées au-dessus des lignes complètes
+    
+    Returns:
+        Board: Plateau de test (lignes complètes non effacées)
+    """
+    # Pièces lâchées sur un plateau moins haut de deux lignes...
+    top = make_board(seed, pieces, height=18)
+    
+    # ...posé sur deux lignes complètes de carrés
+    board = Board(width=10, height=20)
+    full_row = [PIECE_COLORS[PieceType.O]] * board.width
+    board.set_grid(top.grid + [list(full_row), list(full_row)])
+    return board
+
+def make_fixtures(seed=0):
+    """Construit les plateaux de test, du plus vide au plus rempli
+    
+    Args:
+        seed: Graine des plateaux
+    
+    Returns:
+        list: Plateaux de test
+    """
+    return [make_board(seed * 100 + i, pieces) for i, pieces in enumerate((5, 15, 30, 45))]
+
+def make_positions(boards, seed=0):
+    """Tire des positions valides de pièces au-dessus de chaque plateau
+    
+    Args:
+        boards: Plateaux de test
+        seed: Graine des positions
+    
+    Returns:
+        list: Couples (plateau, pièce) avec la pièce à une position valide
+    """
+    rng = random.Random(seed)
+    positions = []
+    for board in boards:
+        for _ in range(16):
+            piece = get_random_piece(rng=rng)
+            piece.rotation = rng.randrange(ROTATION_COUNTS[piece.type])
+            piece.x = rng.choice(board.get_legal_x_range(piece.type, piece.rotation))
+            landing = board.get_landing_y(piece)
+            if landing >= 0:
+                piece.y = rng.randint(0, landing)
+                positions.append((board, piece))
+    return positions
+
+def bench_is_valid_position(fixtures, number):
+    """Prépare le test de collision de pièces à des positions valides"""
+    positions = make_positions(fixtures)
+    calls = [positions[i % len(positions)] for i in range(number)]
+    
+    def run():
+        for board, piece in calls:
+            board.is_valid_position(piece)
+    return run
+
+def bench_add_piece(fixtures, number):
+    """Prépare l'ajout de pièces à leur ligne d'arrivée sur des copies des plateaux"""
+    positions = make_positions(fixtures, seed=1)
+    calls = []
+    for i in range(number):
+        board, piece = positions[i % len(positions)]
+        piece = copy.copy(piece)
+        piece.y = board.get_landing_y(piece)
+        calls.append((board.copy(), piece))
+    
+    def run():
+        for board, piece in calls:
+            board.add_piece(piece)
+    return run
+
+def bench_clear_lines(fixtures, number):
+    """Prépare l'effacement de deux lignes complètes sur des copies de plateaux"""
+    templates = [make_full_rows_board(i, 10 + 5 * i) for i in range(4)]
+    boards = [templates[i % len(templates)].copy() for i in range(number)]
+    
+    def run():
+        for board in boards:
+            board.clear_lines()
+    return run
+
+def bench_get_height_profile(fixtures, number):
+    """Prépare la lecture du profil des hauteurs"""
+    boards = [fixtures[i % len(fixtures)] for i in range(number)]
+    
+    def run():
+        for board in boards:
+            board.get_height_profile()
+    return run
+
+def bench_get_holes_count(fixtures, number):
+    """Prépare le comptage des trous"""
+    boards = [fixtures[i % len(fixtures)] for i in range(number)]
+    
+    def run():
+        for board in boards:
+            board.get_holes_count()
+    return run
+
+def bench_evaluate_position(fixtures, number):
+    """Prépare l'évaluation de positions par l'IA"""
+    ai = AI(Board(width=10, height=20))
+    boards = [fixtures[i % len(fixtures)] for i in range(number)]
+    
+    def run():
+        for board in boards:
+            ai.evaluate_position(board)
+    return run
+
+def bench_get_best_move(fixtures, number):
+    """Prépare la recherche complète du meilleur coup (anticipation comprise)"""
+    rng = random.Random(2)
+    calls = []
+    for i in range(number):
+        board = fixtures[i % len(fixtures)].copy()
+        calls.append((AI(board), get_random_piece(rng=rng), get_random_piece(rng=rng)))
+    
+    def run():
+        # Le hasard de l'IA est fixé pour que chaque répétition fasse le même travail
+        random.seed(0)
+        for ai, piece, next_piece in calls:
+            ai.cache.clear()
+            ai.get_best_move(piece, [next_piece], deadline=float("inf"))
+    return run
+
+def get_hidden_ui():
+    """Retourne une interface complète dans une fenêtre cachée (créée une seule fois)
+    
+    Returns:
+        UI: Interface du jeu
+    """
+    global _hidden_ui
+    if _hidden_ui is None:
+        import tkinter as tk
+        from src.engine import GameEngine
+        from src.ui import UI
+        
+        # Fenêtre cachée : nécessite tout de même un affichage (ou un serveur X virtuel)
+        try:
+            root = tk.Tk()
+        except tk.TclError as error:
+            raise BenchmarkSkipped(f"pas d'affichage disponible ({error})")
+        root.withdraw()
+        _hidden_ui = UI(root, GameEngine())
+    return _hidden_ui
+
+def bench_update_board(fixtures, number):
+    """Prépare le dessin d'un plateau sur un canvas d'une fenêtre cachée"""
+    ui = get_hidden_ui()
+    positions = make_positions(fixtures, seed=3)
+    calls = [positions[i % len(positions)] for i in range(number)]
+    
+    def run():
+        for board, piece in calls:
+            ui.update_board(ui.human_canvas, board, piece)
+        ui.root.update_idletasks()
+    return run
+
+# Benchmarks : nom, fonction de préparation, nombre d'opérations par mesure
+BENCHMARKS = [
+    ("board.is_valid_position", bench_is_valid_position, 20000),
+    ("board.add_piece", bench_add_piece, 5000),
+    ("board.clear_lines", bench_clear_lines, 5000),
+    ("board.get_height_profile", bench_get_height_profile, 50000),
+    ("board.get_holes_count", bench_get_holes_count, 50000),
+    ("ai.evaluate_position", bench_evaluate_position, 20000),
+    ("ai.get_best_move", bench_get_best_move, 20),
+    ("ui.update_board", bench_update_board, 50),
+]
+
+def run_benchmark(setup, number, fixtures, repeat):
+    """Mesure le débit d'un benchmark
+    
+    Args:
+        setup: Fonction de préparation, retourne la fonction mesurée
+        number: Nombre d'opérations par mesure
+        fixtures: Plateaux de test
+        repeat: Nombre de mesures
+    
+    Returns:
+        dict: Débit moyen, écart type, minimum et maximum (opérations/s)
+    """
+    rates = []
+    for _ in range(repeat):
+        # Préparation hors mesure : les opérations qui modifient le plateau
+        # travaillent sur des copies neuves à chaque mesure
+        run = setup(fixtures, number)
+        start = time.perf_counter()
+        run()
+        rates.append(number / (time.perf_counter() - start))
+    
+    return {
+        "ops_per_second": statistics.mean(rates),
+        "stdev": statistics.stdev(rates) if len(rates) > 1 else 0.0,
+        "min": min(rates),
+        "max": max(rates),
+    }
+
+def run_suite(repeat=5, seed=0, names=None, output=print):
+    """Exécute les benchmarks
+    
+    Args:
+        repeat: Nombre de mesures par benchmark
+        seed: Graine des plateaux de test
+        names: Filtre sur les noms de benchmarks (sous-chaînes, optionnel)
+        output: Fonction d'affichage d'une ligne
+    
+    Returns:
+        dict: Résultats par nom de benchmark
+    """
+    fixtures = make_fixtures(seed)
+    results = {}
+    for name, setup, number in BENCHMARKS:
+        if names and not any(part in name for part in names):
+            continue
+        
+        try:
+            result = run_benchmark(setup, number, fixtures, repeat)
+        except BenchmarkSkipped as reason:
+            output(f"{name:28s} ignoré : {reason}")
+            continue
+        
+        results[name] = result
+        spread = 100 * result["stdev"] / result["ops_per_second"]
+        output(
+            f"{name:28s} {result['ops_per_second']:14,.0f} ops/s  ± {spread:5.1f} %  "
+            f"(min {result['min']:,.0f}, max {result['max']:,.0f})"
+        )
+    return results
+
+def compare(results, baseline, threshold, output=print):
+    """Compare les résultats à la référence
+    
+    Args:
+        results: Résultats de run_suite
+        baseline: Résultats de référence
+        threshold: Baisse de débit tolérée (0.1 = 10 %)
+        output: Fonction d'affichage d'une ligne
+    
+    Returns:
+        list: Noms des benchmarks en régression
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            output(f"{name:28s} pas de référence")
+            continue
+        
+        reference = baseline[name]["ops_per_second"]
+        change = result["ops_per_second"] / reference - 1
+        status = "ok"
+        if change < -threshold:
+            status = "RÉGRESSION"
+            regressions.append(name)
+        output(f"{name:28s} {change:+7.1%} par rapport à la référence  {status}")
+    return regressions
+
+def parse_args(argv=None):
+    """Analyse les arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Microbenchmarks du plateau, de l'IA et de l'affichage")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="nombre de mesures par benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="graine des plateaux de test")
+    parser.add_argument("-k", "--filter", action="append", default=None,
+                        help="ne lance que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="fichier JSON de référence")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre les résultats comme nouvelle référence")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="baisse de débit tolérée avant échec (0.10 = 10 %%)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Point d'entrée des benchmarks
+    
+    Returns:
+        int: Code de sortie (1 en cas de régression)
+    """
+    args = parse_args(argv)
+    results = run_suite(repeat=args.repeat, seed=args.seed, names=args.filter)
+    
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"référence enregistrée dans {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"pas de référence ({args.baseline}) : utilisez --save-baseline pour en créer une")
+        return 0
+    
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    
+    print()
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print()
+        print(f"ÉCHEC : {len(regressions)} benchmark(s) plus lent(s) de plus de "
+              f"{args.threshold:.0%} : {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,46 @@
 Classe représentant le plateau de jeu de Tetris
 """
 
+import random
+from src.pieces import ROTATIONS
+
+# Clés de Zobrist partagées par tous les plateaux d'une même taille
+_ZOBRIST_KEYS = {}
+
+def _get_zobrist_keys(width, height):
+    """Retourne les clés de Zobrist (une par cellule) d'un plateau
+    
+    Les clés sont tirées avec une graine fixe : deux plateaux de même taille
+    ayant les mêmes cellules occupées ont donc le même hash.
+    
+    Args:
+        width: Largeur du plateau
+        height: Hauteur du plateau
+    
+    Returns:
+        list: Clés aléatoires sur 64 bits, indexées par [y][x]
+    """
+    keys = _ZOBRIST_KEYS.get((width, height))
+    if keys is None:
+        rng = random.Random(width * 1000 + height)
+        keys = [[rng.getrandbits(64) for _ in range(width)] for _ in range(height)]
+        _ZOBRIST_KEYS[(width, height)] = keys
+    return keys
+
 class Board:
-    """Représentation du plateau de jeu (grille)"""
+    """Représentation du plateau de jeu (grille)
+    
+    Le plateau maintient deux représentations synchronisées :
+    - grid : grille des couleurs, utilisée pour l'affichage
+    - rows : un masque binaire par ligne (bit x = colonne x occupée),
+      utilisé pour les collisions, le placement et la détection des lignes
+    
+    Il tient également à jour, au fil des poses et des lignes effacées :
+    - heights : hauteur de chaque colonne
+    - holes : nombre de trous de chaque colonne
+    - row_fill : nombre de cellules occupées de chaque ligne
+    - hash : hash de Zobrist des cellules occupées (pour les tables de transposition)
+    """
     
     def __init__(self, width=10, height=20):
         """Initialise un nouveau plateau de jeu
@@ -17,109 +55,354 @@ class Board:
         """
         self.width = width
         self.height = height
+        self.full_row = (1 << width) - 1  # Masque d'une ligne complète
         self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.rows = [0] * height
+        
+        # Compteurs maintenus de façon incrémentale (pour l'IA)
+        self.heights = [0] * width
+        self.holes = [0] * width
+        self.row_fill = [0] * height
+        
+        # Hash de Zobrist : XOR des clés des cellules occupées
+        self.zobrist_keys = _get_zobrist_keys(width, height)
+        self.hash = 0
+        
+        # Positions x autorisées pour chaque (type de pièce, rotation)
+        self.x_ranges = {
+            key: range(-info.left, width - info.right)
+            for key, info in ROTATIONS.items()
+        }
+        
+        # Pile des coups joués avec make_move, pour pouvoir les annuler
+        self._history = []
+    
+    def can_place(self, piece, x, y, allow_above=False):
+        """Vérifie si une pièce peut occuper la position (x, y)
+        
+        Args:
+            piece: Pièce à vérifier (sa rotation actuelle est utilisée)
+            x: Position x de la pièce
+            y: Position y de la pièce
+            allow_above: Si True, les cellules au-dessus du plateau sont autorisées
+        
+        Returns:
+            bool: True si la position est libre, False sinon
+        """
+        return self.fits(piece.get_rotation_info(), x, y, allow_above)
+    
+    def fits(self, info, x, y, allow_above=False):
+        """Vérifie si une rotation de pièce peut occuper la position (x, y)
+        
+        Args:
+            info: Informations de la rotation (RotationInfo)
+            x: Position x de la pièce
+            y: Position y de la pièce
+            allow_above: Si True, les cellules au-dessus du plateau sont autorisées
+        
+        Returns:
+            bool: True si la position est libre, False sinon
+        """
+        # Vérifie les limites de la grille à partir de la boîte englobante
+        if x + info.left < 0 or x + info.right >= self.width or y + info.bottom >= self.height:
+            return False
+        if not allow_above and y + info.top < 0:
+            return False
+        
+        # Vérifie les collisions ligne par ligne avec un simple ET binaire
+        rows = self.rows
+        for y_offset, mask in info.masks:
+            row = y + y_offset
+            if row >= 0 and rows[row] & (mask << x if x >= 0 else mask >> -x):
+                return False
+        
+        return True
     
     def is_valid_position(self, piece):
         """Vérifie si une pièce peut être placée à sa position actuelle
         
         Args:
             piece: Pièce à vérifier
-            
+        
         Returns:
             bool: True si la position est valide, False sinon
         """
         if not piece:
             return False
         
-        for y_offset, row in enumerate(piece.get_shape()):
-            for x_offset, cell in enumerate(row):
-                if cell:
-                    # Position de la cellule dans la grille
-                    x = piece.x + x_offset
-                    y = piece.y + y_offset
-                    
-                    # Vérifie si la cellule est dans les limites de la grille
-                    if (x < 0 or x >= self.width or 
-                        y < 0 or y >= self.height or 
-                        # Vérifie si la cellule est déjà occupée
-                        (y >= 0 and self.grid[y][x])):
-                        return False
+        return self.can_place(piece, piece.x, piece.y)
+    
+    def get_legal_x_range(self, piece_type, rotation):
+        """Retourne les positions x où une rotation tient dans la largeur du plateau
         
-        return True
+        Args:
+            piece_type: Type de la pièce (PieceType)
+            rotation: Rotation de la pièce (entre 0 et le nombre de rotations - 1)
+        
+        Returns:
+            range: Positions x autorisées
+        """
+        return self.x_ranges[(piece_type, rotation)]
+    
+    def get_landing_y(self, piece, x=None):
+        """Calcule la ligne d'arrivée d'une pièce lâchée depuis le haut du plateau
+        
+        La ligne est déduite directement de la hauteur des colonnes et du profil
+        du bas de la pièce, sans descendre ligne par ligne. La position x doit
+        faire partie de get_legal_x_range.
+        
+        Args:
+            piece: Pièce à lâcher (sa rotation actuelle est utilisée)
+            x: Position x de la pièce (par défaut, sa position actuelle)
+        
+        Returns:
+            int: Position y d'arrivée (négative si la pièce ne tient pas)
+        """
+        info = piece.get_rotation_info()
+        if x is None:
+            x = piece.x
+        
+        heights = self.heights
+        first_column = x + info.left
+        return min(
+            self.height - heights[first_column + i] - 1 - bottom
+            for i, bottom in enumerate(info.skirt)
+        )
+    
+    def get_drop_position(self, piece):
+        """Calcule la ligne où une pièce s'arrête en tombant depuis sa position actuelle
+        
+        Args:
+            piece: Pièce à faire tomber (à une position valide)
+        
+        Returns:
+            int: Position y d'arrivée
+        """
+        landing_y = self.get_landing_y(piece)
+        if piece.y <= landing_y:
+            # Toutes les cellules entre la pièce et la surface sont vides
+            return landing_y
+        
+        # La pièce est déjà sous la surface (glissée sous un surplomb) :
+        # on descend ligne par ligne
+        y = piece.y
+        while self.can_place(piece, piece.x, y + 1, allow_above=True):
+            y += 1
+        return y
     
     def add_piece(self, piece):
         """Ajoute une pièce au plateau et retourne le nombre de lignes effacées
         
         Args:
             piece: Pièce à ajouter
-            
+        
         Returns:
             int: Nombre de lignes effacées
         """
         if not piece:
             return 0
         
-        # Ajoute la pièce à la grille
-        for y_offset, row in enumerate(piece.get_shape()):
-            for x_offset, cell in enumerate(row):
-                if cell:
-                    x = piece.x + x_offset
-                    y = piece.y + y_offset
-                    
-                    # Vérifie si la position est valide
-                    if 0 <= x < self.width and 0 <= y < self.height:
-                        self.grid[y][x] = piece.color
+        # Ajoute la pièce à la grille et aux masques de lignes
+        self._place_cells(piece)
         
         # Efface les lignes complètes
         return self.clear_lines()
     
+    def make_move(self, piece):
+        """Joue un coup : ajoute une pièce en mémorisant de quoi l'annuler
+        
+        Le coup peut ensuite être annulé exactement avec unmake_move, y compris
+        les lignes effacées. Les coups s'empilent et s'annulent dans l'ordre inverse.
+        
+        Args:
+            piece: Pièce à ajouter
+        
+        Returns:
+            int: Nombre de lignes effacées
+        """
+        # Sauvegarde les lignes touchées par la pièce et les compteurs de colonnes
+        saved_rows = []
+        for y_offset, _ in piece.get_rotation_info().masks:
+            y = piece.y + y_offset
+            if 0 <= y < self.height:
+                saved_rows.append((y, self.rows[y], self.grid[y][:], self.row_fill[y]))
+        saved_columns = (self.heights[:], self.holes[:])
+        saved_hash = self.hash
+        
+        self._place_cells(piece)
+        cleared_rows = self._remove_full_rows()
+        
+        self._history.append((saved_rows, saved_columns, saved_hash, cleared_rows))
+        return len(cleared_rows)
+    
+    def unmake_move(self):
+        """Annule le dernier coup joué avec make_move"""
+        saved_rows, saved_columns, saved_hash, cleared_rows = self._history.pop()
+        
+        if cleared_rows:
+            # Retire les lignes vides ajoutées en haut puis réinsère les lignes
+            # effacées à leur place d'origine (par indices croissants)
+            del self.rows[:len(cleared_rows)]
+            del self.grid[:len(cleared_rows)]
+            del self.row_fill[:len(cleared_rows)]
+            for y, row, grid_row in cleared_rows:
+                self.rows.insert(y, row)
+                self.grid.insert(y, grid_row)
+                self.row_fill.insert(y, self.width)
+        
+        # Restaure les lignes telles qu'elles étaient avant la pose de la pièce
+        for y, row, grid_row, fill in saved_rows:
+            self.rows[y] = row
+            self.grid[y] = grid_row
+            self.row_fill[y] = fill
+        self.heights[:], self.holes[:] = saved_columns
+        self.hash = saved_hash
+    
+    def _place_cells(self, piece):
+        """Écrit les cellules d'une pièce dans la grille et les masques de lignes
+        
+        Args:
+            piece: Pièce à écrire
+        """
+        for x_offset, y_offset in piece.get_rotation_info().cells:
+            x = piece.x + x_offset
+            y = piece.y + y_offset
+            
+            # Vérifie si la position est valide
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.grid[y][x] = piece.color
+                
+                bit = 1 << x
+                if not self.rows[y] & bit:
+                    self.rows[y] |= bit
+                    self.row_fill[y] += 1
+                    self.hash ^= self.zobrist_keys[y][x]
+                    
+                    # Les trous d'une colonne sont les cellules vides sous son sommet :
+                    # trous = hauteur - cellules occupées
+                    filled = self.heights[x] - self.holes[x] + 1
+                    if self.height - y > self.heights[x]:
+                        self.heights[x] = self.height - y
+                    self.holes[x] = self.heights[x] - filled
+    
     def clear_lines(self):
         """Efface les lignes complètes et retourne le nombre de lignes effacées
         
         Returns:
             int: Nombre de lignes effacées
         """
-        lines_cleared = 0
-        y = self.height - 1
+        return len(self._remove_full_rows())
+    
+    def _remove_full_rows(self):
+        """Efface les lignes complètes
+        
+        Returns:
+            list: Lignes effacées (y, masque, ligne de la grille) par y croissant
+        """
+        # Une ligne est complète si son compteur de remplissage vaut la largeur
+        row_fill = self.row_fill
+        if self.width not in row_fill:
+            return []
         
-        while y >= 0:
-            # Vérifie si la ligne est complète
-            if all(self.grid[y]):
-                lines_cleared += 1
-                
-                # Déplace toutes les lignes au-dessus vers le bas
-                for y2 in range(y, 0, -1):
-                    self.grid[y2] = self.grid[y2 - 1].copy()
-                
-                # Crée une nouvelle ligne vide en haut
-                self.grid[0] = [0 for _ in range(self.width)]
-            else:
-                y -= 1
+        cleared_rows = [
+            (y, self.rows[y], self.grid[y])
+            for y in range(self.height)
+            if row_fill[y] == self.width
+        ]
+        kept = [y for y in range(self.height) if row_fill[y] != self.width]
+        lines_cleared = len(cleared_rows)
+        
+        # Les lignes restantes descendent, des lignes vides sont ajoutées en haut
+        self.rows[:] = [0] * lines_cleared + [self.rows[y] for y in kept]
+        self.row_fill[:] = [0] * lines_cleared + [row_fill[y] for y in kept]
+        self.grid[:] = (
+            [[0 for _ in range(self.width)] for _ in range(lines_cleared)] +
+            [self.grid[y] for y in kept]
+        )
         
-        return lines_cleared
+        # Met à jour les colonnes : chacune perd une cellule par ligne effacée
+        rows = self.rows
+        for x in range(self.width):
+            filled = self.heights[x] - self.holes[x] - lines_cleared
+            height = self.heights[x] - lines_cleared
+            
+            # Si le sommet de la colonne a été effacé, cherche le nouveau sommet
+            bit = 1 << x
+            while height > 0 and not rows[self.height - height] & bit:
+                height -= 1
+            
+            self.heights[x] = height
+            self.holes[x] = height - filled
+        
+        # Les lignes ont changé de place : le hash est recalculé
+        self.hash = self._compute_hash()
+        
+        return cleared_rows
+    
+    def _compute_hash(self):
+        """Calcule le hash de Zobrist des cellules occupées
+        
+        Returns:
+            int: Hash sur 64 bits
+        """
+        board_hash = 0
+        for y, row in enumerate(self.rows):
+            keys = self.zobrist_keys[y]
+            while row:
+                lowest_bit = row & -row
+                board_hash ^= keys[lowest_bit.bit_length() - 1]
+                row ^= lowest_bit
+        return board_hash
+    
+    def copy(self):
+        """Retourne une copie indépendante du plateau (sans l'historique des coups)
+        
+        Returns:
+            Board: Nouveau plateau identique
+        """
+        board = Board(self.width, self.height)
+        board.grid = [row[:] for row in self.grid]
+        board.rows = self.rows[:]
+        board.heights = self.heights[:]
+        board.holes = self.holes[:]
+        board.row_fill = self.row_fill[:]
+        board.hash = self.hash
+        return board
     
     def get_grid(self):
         """Retourne la grille actuelle"""
         return self.grid
     
+    def set_grid(self, grid):
+        """Remplace le contenu du plateau et recalcule toutes les représentations
+        
+        Args:
+            grid: Grille des couleurs (height lignes de width cellules, 0 = vide)
+        """
+        self.reset()
+        for y, grid_row in enumerate(grid):
+            self.grid[y] = list(grid_row)
+            for x, cell in enumerate(grid_row):
+                if cell:
+                    self.rows[y] |= 1 << x
+                    self.row_fill[y] += 1
+        
+        # Hauteur et trous de chaque colonne, à partir de sa cellule la plus haute
+        for x in range(self.width):
+            bit = 1 << x
+            top = next((y for y in range(self.height) if self.rows[y] & bit), self.height)
+            self.heights[x] = self.height - top
+            self.holes[x] = sum(1 for y in range(top, self.height) if not self.rows[y] & bit)
+        
+        self.hash = self._compute_hash()
+    
     def get_height_profile(self):
         """Retourne le profil de hauteur de la grille (pour l'IA)
         
         Returns:
             list: Liste des hauteurs de chaque colonne
         """
-        heights = []
-        
-        for x in range(self.width):
-            # Trouve la hauteur de chaque colonne
-            for y in range(self.height):
-                if self.grid[y][x]:
-                    heights.append(self.height - y)
-                    break
-            else:
-                heights.append(0)
-        
-        return heights
+        return self.heights[:]
     
     def get_holes_count(self):
         """Retourne le nombre de trous dans la grille (pour l'IA)
@@ -129,20 +412,22 @@ class Board:
         Returns:
             int: Nombre de trous
         """
-        holes = 0
-        
-        for x in range(self.width):
-            # Trouve le premier bloc de chaque colonne
-            found_block = False
-            for y in range(self.height):
-                if self.grid[y][x]:
-                    found_block = True
-                elif found_block:
-                    # Un trou est une cellule vide sous un bloc
-                    holes += 1
+        return sum(self.holes)
+    
+    def get_complete_lines_count(self):
+        """Retourne le nombre de lignes complètes de la grille (pour l'IA)
         
-        return holes
+        Returns:
+            int: Nombre de lignes complètes
+        """
+        return self.row_fill.count(self.width)
     
     def reset(self):
         """Réinitialise le plateau"""
         self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self.rows = [0] * self.height
+        self.heights = [0] * self.width
+        self.holes = [0] * self.width
+        self.row_fill = [0] * self.height
+        self.hash = 0
+        self._history = []
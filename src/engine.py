@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Moteur du jeu Tetris à deux joueurs, indépendant de l'interface graphique
+Gère les plateaux, les pièces, les scores et les règles spéciales, et permet
+de simuler des parties complètes sans affichage
+"""
+
+import time
+from src.board import Board
+from src.pieces import PieceStream, EASY_TYPES, SPECIAL_TYPES
+from src.ai import AI
+
+# Joueurs de la partie
+PLAYERS = ("human", "ai")
+
+# Points gagnés selon le nombre de lignes effacées d'un coup
+LINE_SCORES = {
+    1: 50,
+    2: 150,  # 50*2 + 50 (bonus)
+    3: 350,  # 50*3 + 200 (bonus)
+    4: 500,  # 50*4 + 300 (bonus)
+}
+
+# Parties de l'état de chaque joueur suivies par des compteurs de version
+# (les règles spéciales ont un compteur commun aux deux joueurs)
+VERSION_KINDS = ("board", "piece", "next", "score")
+
+class SimulatedClock:
+    """Horloge simulée pour les parties sans affichage
+    
+    S'utilise à la place de time.time : le temps n'avance que lorsque le moteur
+    le fait avancer, ce qui permet de simuler des parties bien plus vite que
+    le temps réel.
+    """
+    
+    def __init__(self, start=0.0):
+        """Initialise l'horloge
+        
+        Args:
+            start: Temps de départ en secondes
+        """
+        self.now = start
+    
+    def __call__(self):
+        """Retourne le temps simulé actuel en secondes"""
+        return self.now
+    
+    def advance_to(self, timestamp):
+        """Fait avancer l'horloge jusqu'à un instant donné
+        
+        Args:
+            timestamp: Nouvel instant en secondes (ignoré s'il est dans le passé)
+        """
+        self.now = max(self.now, timestamp)
+
+class GameEngine:
+    """Logique du jeu à deux joueurs, sans interface"""
+    
+    def __init__(self, width=10, height=20, ai_players=("ai",), clock=None, ai_options=None,
+                 seed=None, bag=False, preview=1, replay=None):
+        """Initialise une nouvelle partie
+        
+        Args:
+            width: Largeur des plateaux
+            height: Hauteur des plateaux
+            ai_players: Joueurs contrôlés par l'IA ("human" et/ou "ai")
+            clock: Horloge utilisée par les règles spéciales (par défaut time.time)
+            ai_options: Paramètres passés à chaque IA
+            seed: Graine des flux de pièces (les deux joueurs reçoivent la même suite)
+            bag: Si True, les pièces sont tirées par sacs de sept
+            preview: Nombre de pièces à venir gardées dans chaque flux, après la pièce
+                suivante (augmenté si besoin pour couvrir la profondeur de recherche des IA)
+            replay: Enregistreur des pièces verrouillées (ReplayWriter, optionnel)
+        """
+        self.width = width
+        self.height = height
+        self.ai_players = tuple(ai_players)
+        self.ai_options = dict(ai_options or {})
+        self.clock = clock or time.time
+        self.seed = seed
+        self.bag = bag
+        self.preview = preview
+        self.replay = replay
+        
+        # Variables de jeu
+        self.game_speed = 500  # Vitesse de chute des pièces en ms
+        self.game_running = False
+        self.winner = None
+        
+        # Compteurs de version de l'état, par (partie, joueur) : l'interface ne
+        # redessine que ce qui a changé depuis son dernier affichage
+        self.versions = {}
+        
+        self.reset()
+    
+    def reset(self):
+        """Réinitialise les plateaux, les IA, les scores, les pièces et les règles"""
+        # Plateaux de jeu
+        self.human_board = Board(width=self.width, height=self.height)
+        self.ai_board = Board(width=self.width, height=self.height)
+        
+        # Une IA par joueur contrôlé par l'ordinateur
+        self.ais = {
+            player: AI(self.get_board(player), **self.ai_options)
+            for player in self.ai_players
+        }
+        self.ai = self.ais.get("ai")
+        
+        # Scores
+        self.human_score = 0
+        self.ai_score = 0
+        
+        # Pièces : un flux par joueur, dont l'aperçu couvre les pièces que
+        # les IA prennent en compte après la pièce suivante
+        preview = max([self.preview] + [ai.search_depth - 2 for ai in self.ais.values()])
+        self.piece_streams = {
+            player: PieceStream(seed=self.seed, bag=self.bag, preview=preview)
+            for player in PLAYERS
+        }
+        self.human_current_piece = self.piece_streams["human"].next()
+        self.human_next_piece = self.piece_streams["human"].next()
+        self.ai_current_piece = self.piece_streams["ai"].next()
+        self.ai_next_piece = self.piece_streams["ai"].next()
+        
+        # Règles spéciales
+        self.rainbow_mode = False
+        self.pause_douceur_active = {"human": False, "ai": False}
+        self.pause_douceur_end_time = {"human": 0, "ai": 0}
+        self.last_rainbow_time = self.clock()
+        self.rainbow_end_time = 0
+        
+        # Début de la partie (horodatage des replays)
+        self.start_time = self.clock()
+        
+        # Prochain tick de chaque joueur (pour step)
+        self.next_tick_time = {player: self.clock() for player in PLAYERS}
+        
+        # Statistiques de la partie
+        self.winner = None
+        self.stats = {
+            player: {
+                "pieces": 0,
+                "lines": 0,
+                "decisions": 0,
+                "decision_time": 0.0,
+                "max_decision_time": 0.0,
+            }
+            for player in PLAYERS
+        }
+        
+        # Tout l'état vient de changer
+        for kind in VERSION_KINDS:
+            for player in PLAYERS:
+                self.bump_version(kind, player)
+        self.bump_version("rules")
+    
+    def start(self):
+        """Démarre une nouvelle partie"""
+        self.reset()
+        self.game_running = True
+    
+    def get_board(self, player):
+        """Retourne le plateau d'un joueur"""
+        return self.human_board if player == "human" else self.ai_board
+    
+    def get_current_piece(self, player):
+        """Retourne la pièce en cours d'un joueur"""
+        return getattr(self, f"{player}_current_piece")
+    
+    def get_next_piece(self, player):
+        """Retourne la pièce suivante d'un joueur"""
+        return getattr(self, f"{player}_next_piece")
+    
+    def get_known_pieces(self, player):
+        """Retourne les pièces à venir connues d'un joueur
+        
+        Returns:
+            list: Pièce suivante puis aperçu de son flux, de la plus proche à la plus lointaine
+        """
+        return [self.get_next_piece(player)] + self.piece_streams[player].peek()
+    
+    def get_score(self, player):
+        """Retourne le score d'un joueur"""
+        return getattr(self, f"{player}_score")
+    
+    def get_opponent(self, player):
+        """Retourne l'adversaire d'un joueur"""
+        return "ai" if player == "human" else "human"
+    
+    def bump_version(self, kind, player=None):
+        """Signale un changement d'une partie de l'état
+        
+        Args:
+            kind: Partie de l'état ("board", "piece", "next", "score" ou "rules")
+            player: Joueur concerné (None pour les règles spéciales)
+        """
+        key = (kind, player)
+        self.versions[key] = self.versions.get(key, 0) + 1
+    
+    def get_version(self, kind, player=None):
+        """Retourne le compteur de version d'une partie de l'état
+        
+        Args:
+            kind: Partie de l'état ("board", "piece", "next", "score" ou "rules")
+            player: Joueur concerné (None pour les règles spéciales)
+        
+        Returns:
+            int: Valeur qui change à chaque modification de cette partie
+        """
+        return self.versions.get((kind, player), 0)
+    
+    def step(self):
+        """Fait avancer la partie d'un tick
+        
+        Le joueur dont le prochain tick est le plus proche joue : chute d'une ligne
+        pour un joueur humain, décision complète pour une IA. Chaque joueur joue
+        à sa propre vitesse (get_current_speed). Avec une SimulatedClock, le temps
+        simulé avance jusqu'à l'instant du tick.
+        
+        Returns:
+            bool: True si la partie continue, False si elle est terminée
+        """
+        if not self.game_running:
+            return False
+        
+        player = min(PLAYERS, key=self.next_tick_time.__getitem__)
+        tick_time = self.next_tick_time[player]
+        if isinstance(self.clock, SimulatedClock):
+            self.clock.advance_to(tick_time)
+        
+        # Vérifie les règles spéciales
+        self.check_special_rules()
+        
+        self.tick(player)
+        
+        # Programme le prochain tick du joueur
+        self.next_tick_time[player] = tick_time + self.get_current_speed(player) / 1000
+        return self.game_running
+    
+    def run_until_game_over(self, max_steps=None, max_pieces=None):
+        """Joue la partie jusqu'à sa fin
+        
+        Args:
+            max_steps: Nombre maximal de ticks (optionnel)
+            max_pieces: Nombre maximal de pièces posées par joueur (optionnel)
+        
+        Returns:
+            str: Gagnant ("human" ou "ai"), ou None si une limite a été atteinte
+        """
+        if not self.game_running:
+            self.start()
+        
+        steps = 0
+        while self.step():
+            steps += 1
+            if max_steps is not None and steps >= max_steps:
+                break
+            if max_pieces is not None and max(s["pieces"] for s in self.stats.values()) >= max_pieces:
+                break
+        
+        return self.winner
+    
+    def tick(self, player):
+        """Exécute un tick pour un joueur
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+        """
+        if player in self.ais:
+            self.play_ai_turn(player)
+        else:
+            self.gravity_tick(player)
+    
+    def gravity_tick(self, player):
+        """Fait tomber la pièce d'un joueur d'une ligne, ou la verrouille
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+        """
+        if self.can_move_piece(0, 1, self.get_current_piece(player), self.get_board(player)):
+            self.move_piece(player, 0, 1)
+        else:
+            self.lock_piece(player)
+    
+    def play_ai_turn(self, player):
+        """Fait jouer un coup complet à l'IA d'un joueur
+        
+        Args:
+            player: Joueur contrôlé par l'IA
+        """
+        start = time.perf_counter()
+        move = self.ais[player].get_best_move(
+            self.get_current_piece(player), self.get_known_pieces(player)
+        )
+        self.record_decision_time(player, time.perf_counter() - start)
+        
+        self.apply_ai_move(player, move)
+    
+    def record_decision_time(self, player, seconds):
+        """Enregistre la durée d'une décision de l'IA
+        
+        Args:
+            player: Joueur contrôlé par l'IA
+            seconds: Durée de la décision en secondes
+        """
+        stats = self.stats[player]
+        stats["decisions"] += 1
+        stats["decision_time"] += seconds
+        stats["max_decision_time"] = max(stats["max_decision_time"], seconds)
+    
+    def apply_ai_move(self, player, move):
+        """Applique le coup choisi par l'IA et verrouille sa pièce
+        
+        Args:
+            player: Joueur contrôlé par l'IA
+            move: Coup choisi (x, y et rotation) ou None
+        """
+        piece = self.get_current_piece(player)
+        if move:
+            # Place la pièce directement à sa position d'arrivée, éventuellement
+            # sous un surplomb (l'IA a vérifié qu'elle est atteignable)
+            piece.x = move["x"]
+            piece.rotation = move["rotation"]
+            piece.y = move["y"]
+        
+        # Si aucun mouvement valide n'est trouvé, la pièce est verrouillée sur place
+        self.lock_piece(player)
+    
+    def get_current_speed(self, player):
+        """Retourne la vitesse actuelle du jeu pour un joueur donné"""
+        speed = self.game_speed
+        
+        # Ralentissement si "Pause douceur" est active
+        if self.pause_douceur_active[player]:
+            speed = int(speed * 1.2)  # 20% plus lent
+            
+            # Vérifie si la pause douceur est terminée
+            if self.clock() > self.pause_douceur_end_time[player]:
+                self.pause_douceur_active[player] = False
+                self.bump_version("rules")
+        
+        return speed
+    
+    def get_fall_progress(self, player):
+        """Retourne l'avancement de la chute de la pièce d'un joueur vers la ligne suivante
+        
+        Sert à dessiner la pièce entre deux ticks de gravité.
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+        
+        Returns:
+            float: Fraction de cellule entre 0 et 1 (0 si la pièce ne peut plus descendre)
+        """
+        piece = self.get_current_piece(player)
+        if not self.game_running or not self.can_move_piece(0, 1, piece, self.get_board(player)):
+            return 0.0
+        
+        interval = self.get_current_speed(player) / 1000
+        progress = 1 - (self.next_tick_time[player] - self.clock()) / interval
+        return min(max(progress, 0.0), 1.0)
+    
+    def can_move_piece(self, dx, dy, piece, board):
+        """Vérifie si un mouvement est possible pour une pièce"""
+        if not piece:
+            return False
+        
+        # Les cellules au-dessus du plateau sont autorisées (apparition des pièces)
+        return board.can_place(piece, piece.x + dx, piece.y + dy, allow_above=True)
+    
+    def move_piece(self, player, dx, dy):
+        """Déplace la pièce d'un joueur"""
+        piece = self.get_current_piece(player)
+        if not self.game_running or not piece:
+            return False
+        
+        if self.can_move_piece(dx, dy, piece, self.get_board(player)):
+            piece.x += dx
+            piece.y += dy
+            self.bump_version("piece", player)
+            return True
+        return False
+    
+    def rotate_piece(self, player):
+        """Fait pivoter la pièce d'un joueur"""
+        piece = self.get_current_piece(player)
+        if not self.game_running or not piece:
+            return False
+        
+        # Sauvegarde la rotation actuelle
+        old_rotation = piece.rotation
+        
+        # Essaye de faire pivoter la pièce
+        piece.rotate()
+        
+        # Vérifie si la rotation est valide
+        if not self.can_move_piece(0, 0, piece, self.get_board(player)):
+            # Restaure la rotation si elle est invalide
+            piece.rotation = old_rotation
+            return False
+        
+        self.bump_version("piece", player)
+        return True
+    
+    def hard_drop_piece(self, player):
+        """Fait tomber instantanément la pièce d'un joueur"""
+        piece = self.get_current_piece(player)
+        if not self.game_running or not piece:
+            return
+        
+        # Fait tomber la pièce directement jusqu'à sa ligne d'arrivée
+        piece.y = self.get_board(player).get_drop_position(piece)
+        
+        # Verrouille la pièce
+        self.lock_piece(player)
+    
+    def lock_piece(self, player):
+        """Verrouille la pièce d'un joueur sur son plateau"""
+        piece = self.get_current_piece(player)
+        if not piece:
+            return
+        
+        board = self.get_board(player)
+        
+        # Ajoute la pièce au plateau, efface les lignes complètes et met à jour le score
+        cleared_lines = board.add_piece(piece)
+        self.stats[player]["pieces"] += 1
+        self.stats[player]["lines"] += cleared_lines
+        self.update_score(player, cleared_lines)
+        
+        # Vérifie les règles spéciales
+        self.check_gift_rule(player, cleared_lines)
+        
+        # Enregistre le coup dans le replay
+        if self.replay:
+            self.record_replay(player, piece, cleared_lines)
+        
+        # Passe à la pièce suivante (la pièce verrouillée est rendue à son flux)
+        stream = self.piece_streams[player]
+        stream.release(piece)
+        setattr(self, f"{player}_current_piece", self.get_next_piece(player))
+        setattr(self, f"{player}_next_piece", stream.next())
+        self.bump_version("board", player)
+        self.bump_version("piece", player)
+        self.bump_version("next", player)
+        
+        # Vérifie si la partie est terminée
+        if not self.can_move_piece(0, 0, self.get_current_piece(player), board):
+            self.game_over(self.get_opponent(player))
+    
+    def record_replay(self, player, piece, cleared_lines):
+        """Enregistre une pièce verrouillée dans le replay, avec une image clé si nécessaire
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+            piece: Pièce verrouillée
+            cleared_lines: Nombre de lignes effacées
+        """
+        self.replay.record(player, piece, cleared_lines, 1000 * (self.clock() - self.start_time))
+        if self.replay.keyframe_due():
+            self.replay.write_keyframe(self.human_board, self.ai_board, self.human_score, self.ai_score)
+    
+    def move_human_piece(self, dx, dy):
+        """Déplace la pièce du joueur humain"""
+        return self.move_piece("human", dx, dy)
+    
+    def rotate_human_piece(self):
+        """Fait pivoter la pièce du joueur humain"""
+        return self.rotate_piece("human")
+    
+    def hard_drop_human_piece(self):
+        """Fait tomber instantanément la pièce du joueur humain"""
+        self.hard_drop_piece("human")
+    
+    def lock_human_piece(self):
+        """Verrouille la pièce du joueur humain sur le plateau"""
+        self.lock_piece("human")
+    
+    def lock_ai_piece(self):
+        """Verrouille la pièce de l'IA sur le plateau"""
+        self.lock_piece("ai")
+    
+    def update_score(self, player, cleared_lines):
+        """Met à jour le score d'un joueur en fonction des lignes effacées"""
+        score = LINE_SCORES.get(cleared_lines, 0)
+        
+        if not score:
+            return
+        
+        new_score = self.get_score(player) + score
+        setattr(self, f"{player}_score", new_score)
+        self.bump_version("score", player)
+        
+        # Vérifie si on active la "Pause douceur"
+        if new_score // 1000 > (new_score - score) // 1000:
+            self.activate_pause_douceur(player)
+            self.activate_pause_douceur(self.get_opponent(player))
+        
+        # Vérifie si on active la "Pièce rigolote"
+        if new_score // 3000 > (new_score - score) // 3000:
+            self.activate_funny_piece(player)
+    
+    def check_gift_rule(self, player, cleared_lines):
+        """Vérifie et applique la règle "Cadeau surprise" si nécessaire"""
+        if cleared_lines == 2:
+            # Détermine quel joueur reçoit le cadeau
+            recipient = self.get_opponent(player)
+            
+            # Tire une pièce facile (carré ou ligne) qui remplace la prochaine pièce
+            # du joueur qui reçoit le cadeau
+            self.replace_next_piece(recipient, EASY_TYPES)
+    
+    def activate_pause_douceur(self, player):
+        """Active la règle "Pause douceur" pour un joueur"""
+        self.pause_douceur_active[player] = True
+        self.pause_douceur_end_time[player] = self.clock() + 10  # Dure 10 secondes
+        self.bump_version("rules")
+    
+    def activate_funny_piece(self, player):
+        """Active la règle "Pièce rigolote" pour un joueur"""
+        # Tire une pièce spéciale (cœur ou étoile) qui remplace la prochaine pièce
+        self.replace_next_piece(player, SPECIAL_TYPES)
+    
+    def replace_next_piece(self, player, types):
+        """Remplace la prochaine pièce d'un joueur par une pièce tirée parmi certains types
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+            types: Types possibles de la nouvelle pièce
+        """
+        stream = self.piece_streams[player]
+        stream.release(self.get_next_piece(player))
+        setattr(self, f"{player}_next_piece", stream.draw(types))
+        self.bump_version("next", player)
+    
+    def check_special_rules(self):
+        """Vérifie et applique les règles spéciales basées sur le temps"""
+        current_time = self.clock()
+        
+        # Vérifie la règle "Arc-en-ciel"
+        if current_time - self.last_rainbow_time >= 120:  # 2 minutes
+            self.activate_rainbow_mode()
+            self.last_rainbow_time = current_time
+        
+        # Désactive le mode arc-en-ciel si nécessaire
+        if self.rainbow_mode and current_time > self.rainbow_end_time:
+            self.rainbow_mode = False
+            self.bump_version("rules")
+    
+    def activate_rainbow_mode(self):
+        """Active la règle "Arc-en-ciel" pour les deux joueurs"""
+        self.rainbow_mode = True
+        self.rainbow_end_time = self.clock() + 20  # Dure 20 secondes
+        self.bump_version("rules")
+    
+    def game_over(self, winner):
+        """Termine la partie et enregistre le gagnant"""
+        self.game_running = False
+        self.winner = winner
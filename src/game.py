@@ -2,26 +2,47 @@
 # -*- coding: utf-8 -*-
 
 """
-Classe principale du jeu Tetris à deux joueurs
-Gère la logique du jeu et coordonne les interactions entre les composants
+Interface Tkinter du jeu Tetris à deux joueurs
+Relie le moteur de jeu (src.engine) à l'affichage, au clavier et au temps réel
 """
 
 import time
-import random
 import tkinter as tk
-from src.board import Board
-from src.pieces import get_random_piece, PieceType
-from src.ai import AI
+from src.engine import GameEngine, PLAYERS
+from src.ai_worker import AIWorker
 from src.ui import UI
+from src.profiler import profiler, Histogram
 
-class Game:
-    """Classe principale qui gère le déroulement du jeu"""
+# Pas de temps de la boucle de jeu (ms) : logique et résultats de l'IA
+FRAME_INTERVAL = 16
+
+# Cadence visée par défaut de la boucle d'affichage (images par seconde)
+TARGET_FPS = 60
+
+# Nombre maximal de ticks rattrapés d'un coup par un joueur en retard
+MAX_CATCH_UP_TICKS = 3
+
+class Game(GameEngine):
+    """Classe principale qui gère le déroulement du jeu en temps réel
+    
+    Une seule boucle (run_frame), cadencée à pas fixe, fait avancer les deux joueurs :
+    chaque joueur joue dès que l'échéance de son prochain tick est atteinte, et ses
+    échéances sont calculées les unes à partir des autres (et non à partir de
+    l'instant où le tick a réellement eu lieu), si bien que les retards ne
+    s'accumulent pas.
+    
+    L'affichage a sa propre boucle (run_render), cadencée à target_fps
+    indépendamment des ticks : la pièce du joueur humain y descend en continu
+    entre deux ticks, et les images en retard sont sautées plutôt que rattrapées.
+    """
     
-    def __init__(self, use_custom_tkinter=False):
+    def __init__(self, use_custom_tkinter=False, target_fps=TARGET_FPS, renderer="tiles"):
         """Initialise une nouvelle partie de Tetris
         
         Args:
             use_custom_tkinter: Booléen indiquant si on utilise CustomTkinter
+            target_fps: Cadence visée de l'affichage (images par seconde)
+            renderer: Rendu des grilles de cellules ("tiles" ou "items", voir ui.RENDERERS)
         """
         # Utiliser CustomTkinter si demandé
         if use_custom_tkinter:
@@ -33,32 +54,28 @@ class Game:
         self.root.title("Tetris à deux joueurs (Humain vs IA)")
         self.root.configure(bg="#2C3E50")
         
-        # Initialisation des plateaux de jeu
-        self.human_board = Board(width=10, height=20)
-        self.ai_board = Board(width=10, height=20)
+        # Initialisation du moteur : plateaux, pièces, scores et IA
+        # (horloge monotone, utilisée aussi pour cadencer la boucle de jeu)
+        super().__init__(width=10, height=20, clock=time.perf_counter,
+                         ai_options={"reachable_moves": True})
         
-        # Initialisation de l'IA
-        self.ai = AI(self.ai_board)
+        # L'IA décide dans un thread séparé
+        self.ai_worker = AIWorker(self.ai)
+        self.ai_request_id = 0
+        self.ai_pending = False
         
-        # Initialisation de l'interface utilisateur
-        self.ui = UI(self.root, self)
+        # Boucle de jeu
+        self.frame_job = None
+        self.frame_deadline = 0
         
-        # Variables de jeu
-        self.human_score = 0
-        self.ai_score = 0
-        self.human_current_piece = None
-        self.human_next_piece = None
-        self.ai_current_piece = None
-        self.ai_next_piece = None
-        self.game_speed = 500  # Vitesse de chute des pièces en ms
-        self.game_running = False
-        self.rainbow_mode = False
-        self.pause_douceur_active = {"human": False, "ai": False}
-        self.pause_douceur_end_time = {"human": 0, "ai": 0}
+        # Boucle d'affichage et statistiques des images
+        self.target_fps = target_fps
+        self.render_job = None
+        self.render_deadline = 0
+        self.reset_frame_stats()
         
-        # Timers pour les règles spéciales
-        self.last_rainbow_time = time.time()
-        self.rainbow_end_time = 0
+        # Initialisation de l'interface utilisateur
+        self.ui = UI(self.root, self, renderer=renderer)
         
         # Configuration des événements clavier
         self.setup_keyboard_events()
@@ -72,290 +89,191 @@ class Game:
         self.root.bind("<space>", lambda event: self.hard_drop_human_piece())
         self.root.bind("p", lambda event: self.toggle_pause())
         self.root.bind("r", lambda event: self.restart_game())
+        self.root.bind("<F3>", lambda event: self.ui.toggle_profiler_overlay())
     
     def start(self):
         """Démarre le jeu"""
         self.game_running = True
-        self.human_current_piece = get_random_piece()
-        self.human_next_piece = get_random_piece()
-        self.ai_current_piece = get_random_piece()
-        self.ai_next_piece = get_random_piece()
         
-        # Démarrage des boucles de jeu
-        self.update_game()
-        self.run_ai_turn()
+        # Démarrage de la boucle de jeu
+        self.start_frame_loop()
         
         # Démarrage de la boucle principale Tkinter
         self.root.mainloop()
     
-    def update_game(self):
-        """Met à jour l'état du jeu à chaque tick"""
-        if not self.game_running:
-            return
-        
-        # Vérifie les règles spéciales
-        self.check_special_rules()
-        
-        # Fait tomber la pièce du joueur humain
-        if self.can_move_piece(0, 1, self.human_current_piece, self.human_board):
-            self.move_human_piece(0, 1)
-        else:
-            self.lock_human_piece()
-        
-        # Met à jour l'affichage
-        self.ui.update_display()
-        
-        # Programme le prochain tick
-        speed = self.get_current_speed("human")
-        self.root.after(speed, self.update_game)
+    def start_frame_loop(self):
+        """(Re)démarre les boucles de jeu et d'affichage, avec des échéances repartant de maintenant"""
+        if self.frame_job is not None:
+            self.root.after_cancel(self.frame_job)
+            self.frame_job = None
+        if self.render_job is not None:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
+        
+        # Toute décision de l'IA encore en cours est périmée
+        self.ai_request_id += 1
+        self.ai_pending = False
+        
+        now = self.clock()
+        for player in PLAYERS:
+            self.next_tick_time[player] = now + self.get_current_speed(player) / 1000
+        self.frame_deadline = now
+        self.render_deadline = now
+        self.reset_frame_stats()
+        
+        self.run_frame()
+        self.run_render()
     
-    def run_ai_turn(self):
-        """Exécute le tour de l'IA"""
+    def run_frame(self):
+        """Exécute un pas de la boucle de jeu puis programme le suivant"""
+        profiler.fired("game.frame")
+        self.frame_job = None
         if not self.game_running:
             return
         
-        # L'IA prend sa décision
-        move = self.ai.get_best_move(self.ai_current_piece)
-        
-        # Applique le mouvement
-        if move:
-            self.ai_current_piece.x = move["x"]
-            self.ai_current_piece.rotation = move["rotation"]
+        with profiler.timed("game.frame"):
+            now = self.clock()
             
-            # Fait tomber la pièce de l'IA
-            while self.can_move_piece(0, 1, self.ai_current_piece, self.ai_board):
-                self.ai_current_piece.y += 1
-            self.lock_ai_piece()
-        else:
-            # Si aucun mouvement valide n'est trouvé, on fait tomber la pièce
-            self.lock_ai_piece()
-        
-        # Met à jour l'affichage
-        self.ui.update_display()
-        
-        # Programme le prochain tour de l'IA
-        speed = self.get_current_speed("ai")
-        self.root.after(speed, self.run_ai_turn)
-    
-    def get_current_speed(self, player):
-        """Retourne la vitesse actuelle du jeu pour un joueur donné"""
-        speed = self.game_speed
-        
-        # Ralentissement si "Pause douceur" est active
-        if self.pause_douceur_active[player]:
-            speed = int(speed * 1.2)  # 20% plus lent
+            # Vérifie les règles spéciales
+            self.check_special_rules()
             
-            # Vérifie si la pause douceur est terminée
-            if time.time() > self.pause_douceur_end_time[player]:
-                self.pause_douceur_active[player] = False
+            # Fait avancer chaque joueur dont le tick est dû
+            self.update_game(now)
+            if self.game_running:
+                self.run_ai_turn(now)
         
-        return speed
-    
-    def can_move_piece(self, dx, dy, piece, board):
-        """Vérifie si un mouvement est possible pour une pièce"""
-        if not piece:
-            return False
-        
-        new_x = piece.x + dx
-        new_y = piece.y + dy
-        shape = piece.get_shape()
-        
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = new_x + x
-                    board_y = new_y + y
-                    if (board_x < 0 or board_x >= board.width or
-                        board_y >= board.height or
-                        (board_y >= 0 and board.grid[board_y][board_x])):
-                        return False
-        return True
-    
-    def move_human_piece(self, dx, dy):
-        """Déplace la pièce du joueur humain"""
-        if not self.game_running or not self.human_current_piece:
-            return False
+        if not self.game_running:
+            return
         
-        if self.can_move_piece(dx, dy, self.human_current_piece, self.human_board):
-            self.human_current_piece.x += dx
-            self.human_current_piece.y += dy
-            return True
-        return False
+        # Programme le pas suivant à échéance fixe, en compensant la durée de celui-ci ;
+        # après un long blocage, on repart de maintenant au lieu d'enchaîner les pas
+        self.frame_deadline += FRAME_INTERVAL / 1000
+        now = self.clock()
+        if self.frame_deadline < now - FRAME_INTERVAL / 1000:
+            self.frame_deadline = now
+        delay = max(0, int((self.frame_deadline - now) * 1000))
+        self.frame_job = self.root.after(delay, self.run_frame)
+        profiler.scheduled("game.frame", delay)
     
-    def rotate_human_piece(self):
-        """Fait pivoter la pièce du joueur humain"""
-        if not self.game_running or not self.human_current_piece:
-            return False
-        
-        # Sauvegarde la rotation actuelle
-        old_rotation = self.human_current_piece.rotation
-        
-        # Essaye de faire pivoter la pièce
-        self.human_current_piece.rotate()
+    def run_render(self):
+        """Dessine une image puis programme la suivante
         
-        # Vérifie si la rotation est valide
-        if not self.can_move_piece(0, 0, self.human_current_piece, self.human_board):
-            # Restaure la rotation si elle est invalide
-            self.human_current_piece.rotation = old_rotation
-            return False
-        
-        return True
-    
-    def hard_drop_human_piece(self):
-        """Fait tomber instantanément la pièce du joueur humain"""
-        if not self.game_running or not self.human_current_piece:
+        Seuls les widgets dont l'état a changé sont redessinés (voir
+        UI.update_display), en plus de la pièce en chute interpolée. Si une
+        image est en retard, les échéances manquées sont sautées : l'affichage
+        ne cherche pas à rattraper les images perdues.
+        """
+        profiler.fired("ui.render")
+        self.render_job = None
+        if not self.game_running:
             return
         
-        # Fait tomber la pièce jusqu'à ce qu'elle ne puisse plus descendre
-        while self.move_human_piece(0, 1):
-            pass
-        
-        # Verrouille la pièce
-        self.lock_human_piece()
+        start = time.perf_counter()
+        with profiler.timed("ui.render"):
+            self.ui.update_display()
+        self.frame_times.add(1000 * (time.perf_counter() - start))
+        
+        # Programme l'image suivante à échéance fixe ; les échéances déjà
+        # dépassées sont comptées comme des images sautées
+        interval = 1 / self.target_fps
+        self.render_deadline += interval
+        now = self.clock()
+        if self.render_deadline < now:
+            skipped = int((now - self.render_deadline) / interval) + 1
+            self.frames_skipped += skipped
+            self.render_deadline += skipped * interval
+        delay = max(0, int((self.render_deadline - now) * 1000))
+        self.render_job = self.root.after(delay, self.run_render)
+        profiler.scheduled("ui.render", delay)
     
-    def lock_human_piece(self):
-        """Verrouille la pièce du joueur humain sur le plateau"""
-        if not self.human_current_piece:
-            return
-        
-        # Ajoute la pièce au plateau
-        shape = self.human_current_piece.get_shape()
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = self.human_current_piece.x + x
-                    board_y = self.human_current_piece.y + y
-                    if 0 <= board_y < self.human_board.height and 0 <= board_x < self.human_board.width:
-                        self.human_board.grid[board_y][board_x] = self.human_current_piece.color
-        
-        # Efface les lignes complètes et met à jour le score
-        cleared_lines = self.human_board.clear_lines()
-        self.update_score("human", cleared_lines)
-        
-        # Vérifie les règles spéciales
-        self.check_gift_rule("human", cleared_lines)
-        
-        # Passe à la pièce suivante
-        self.human_current_piece = self.human_next_piece
-        self.human_next_piece = get_random_piece()
-        
-        # Vérifie si la partie est terminée
-        if not self.can_move_piece(0, 0, self.human_current_piece, self.human_board):
-            self.game_over("ai")
+    def reset_frame_stats(self):
+        """Remet à zéro les statistiques des images"""
+        self.frame_times = Histogram()
+        self.frames_skipped = 0
+        self.frame_stats_start = self.clock()
     
-    def lock_ai_piece(self):
-        """Verrouille la pièce de l'IA sur le plateau"""
-        if not self.ai_current_piece:
-            return
-        
-        # Ajoute la pièce au plateau
-        shape = self.ai_current_piece.get_shape()
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = self.ai_current_piece.x + x
-                    board_y = self.ai_current_piece.y + y
-                    if 0 <= board_y < self.ai_board.height and 0 <= board_x < self.ai_board.width:
-                        self.ai_board.grid[board_y][board_x] = self.ai_current_piece.color
-        
-        # Efface les lignes complètes et met à jour le score
-        cleared_lines = self.ai_board.clear_lines()
-        self.update_score("ai", cleared_lines)
-        
-        # Vérifie les règles spéciales
-        self.check_gift_rule("ai", cleared_lines)
+    def get_frame_stats(self):
+        """Retourne les statistiques de la boucle d'affichage
         
-        # Passe à la pièce suivante
-        self.ai_current_piece = self.ai_next_piece
-        self.ai_next_piece = get_random_piece()
-        
-        # Vérifie si la partie est terminée
-        if not self.can_move_piece(0, 0, self.ai_current_piece, self.ai_board):
-            self.game_over("human")
+        Returns:
+            dict: Cadence visée et mesurée (images par seconde), nombre d'images
+            dessinées et sautées, durée moyenne, 95e centile et maximum d'une
+            image (ms)
+        """
+        elapsed = self.clock() - self.frame_stats_start
+        frame_times = self.frame_times
+        return {
+            "target_fps": self.target_fps,
+            "fps": frame_times.count / elapsed if elapsed > 0 else 0.0,
+            "frames": frame_times.count,
+            "skipped": self.frames_skipped,
+            "mean_ms": frame_times.mean(),
+            "p95_ms": frame_times.percentile(0.95),
+            "max_ms": frame_times.max,
+        }
     
-    def update_score(self, player, cleared_lines):
-        """Met à jour le score d'un joueur en fonction des lignes effacées"""
-        score = 0
-        if cleared_lines == 1:
-            score = 50
-        elif cleared_lines == 2:
-            score = 150  # 50*2 + 50 (bonus)
-        elif cleared_lines == 3:
-            score = 350  # 50*3 + 200 (bonus)
-        elif cleared_lines == 4:
-            score = 500  # 50*4 + 300 (bonus)
+    def advance_deadline(self, player, now):
+        """Programme le prochain tick d'un joueur à partir de l'échéance précédente
         
-        if player == "human":
-            self.human_score += score
-            
-            # Vérifie si on active la "Pause douceur"
-            if self.human_score // 1000 > (self.human_score - score) // 1000:
-                self.activate_pause_douceur("human")
-                self.activate_pause_douceur("ai")
-            
-            # Vérifie si on active la "Pièce rigolote"
-            if self.human_score // 3000 > (self.human_score - score) // 3000:
-                self.activate_funny_piece("human")
-        else:
-            self.ai_score += score
-            
-            # Vérifie si on active la "Pause douceur"
-            if self.ai_score // 1000 > (self.ai_score - score) // 1000:
-                self.activate_pause_douceur("ai")
-                self.activate_pause_douceur("human")
-            
-            # Vérifie si on active la "Pièce rigolote"
-            if self.ai_score // 3000 > (self.ai_score - score) // 3000:
-                self.activate_funny_piece("ai")
-    
-    def check_gift_rule(self, player, cleared_lines):
-        """Vérifie et applique la règle "Cadeau surprise" si nécessaire"""
-        if cleared_lines == 2:
-            # Détermine quel joueur reçoit le cadeau
-            recipient = "ai" if player == "human" else "human"
-            
-            # Crée une pièce facile (carré ou ligne)
-            easy_piece = get_random_piece(only_easy=True)
-            
-            # Remplace la prochaine pièce du joueur qui reçoit le cadeau
-            if recipient == "human":
-                self.human_next_piece = easy_piece
-            else:
-                self.ai_next_piece = easy_piece
-    
-    def activate_pause_douceur(self, player):
-        """Active la règle "Pause douceur" pour un joueur"""
-        self.pause_douceur_active[player] = True
-        self.pause_douceur_end_time[player] = time.time() + 10  # Dure 10 secondes
+        La vitesse vient de get_current_speed, si bien que la "Pause douceur"
+        s'applique. Si le joueur a trop de retard, l'échéance repart de maintenant.
+        
+        Args:
+            player: Joueur concerné ("human" ou "ai")
+            now: Instant actuel (horloge du jeu)
+        """
+        interval = self.get_current_speed(player) / 1000
+        self.next_tick_time[player] += interval
+        if self.next_tick_time[player] < now - MAX_CATCH_UP_TICKS * interval:
+            self.next_tick_time[player] = now + interval
     
-    def activate_funny_piece(self, player):
-        """Active la règle "Pièce rigolote" pour un joueur"""
-        # Crée une pièce spéciale (cœur ou étoile)
-        special_piece = get_random_piece(special=True)
+    def update_game(self, now):
+        """Fait tomber la pièce du joueur humain pour chaque tick dû
         
-        # Remplace la prochaine pièce du joueur
-        if player == "human":
-            self.human_next_piece = special_piece
-        else:
-            self.ai_next_piece = special_piece
+        Args:
+            now: Instant actuel (horloge du jeu)
+        """
+        with profiler.timed("game.update_game"):
+            ticks = 0
+            while self.game_running and now >= self.next_tick_time["human"] and ticks < MAX_CATCH_UP_TICKS:
+                self.gravity_tick("human")
+                self.advance_deadline("human", now)
+                ticks += 1
     
-    def check_special_rules(self):
-        """Vérifie et applique les règles spéciales basées sur le temps"""
-        current_time = time.time()
+    def run_ai_turn(self, now):
+        """Fait avancer le tour de l'IA
         
-        # Vérifie la règle "Arc-en-ciel"
-        if current_time - self.last_rainbow_time >= 120:  # 2 minutes
-            self.activate_rainbow_mode()
-            self.last_rainbow_time = current_time
+        La décision est calculée en arrière-plan pour ne pas bloquer l'interface :
+        le résultat est appliqué dès qu'il est prêt, et une nouvelle décision est
+        demandée quand le tick suivant de l'IA est dû.
         
-        # Désactive le mode arc-en-ciel si nécessaire
-        if self.rainbow_mode and current_time > self.rainbow_end_time:
-            self.rainbow_mode = False
-    
-    def activate_rainbow_mode(self):
-        """Active la règle "Arc-en-ciel" pour les deux joueurs"""
-        self.rainbow_mode = True
-        self.rainbow_end_time = time.time() + 20  # Dure 20 secondes
+        Args:
+            now: Instant actuel (horloge du jeu)
+        """
+        with profiler.timed("game.run_ai_turn"):
+            if self.ai_pending:
+                # Ignore les résultats de demandes périmées (partie redémarrée, pause)
+                result = self.ai_worker.poll()
+                while result is not None and result[0] != self.ai_request_id:
+                    result = self.ai_worker.poll()
+                
+                if result is None:
+                    # Décision pas encore prête : on réessaie au prochain pas
+                    return
+                
+                _, move, elapsed = result
+                self.ai_pending = False
+                self.record_decision_time("ai", elapsed)
+                self.apply_ai_move("ai", move)
+            
+            # Demande sa décision à l'IA quand son tick est dû
+            if self.game_running and now >= self.next_tick_time["ai"]:
+                self.ai_request_id += 1
+                self.ai_worker.submit(
+                    self.ai_request_id, self.ai_board, self.ai_current_piece, self.get_known_pieces("ai")
+                )
+                self.ai_pending = True
+                self.advance_deadline("ai", now)
     
     def toggle_pause(self):
         """Met le jeu en pause ou le reprend"""
@@ -363,42 +281,23 @@ class Game:
         
         if self.game_running:
             # Reprendre le jeu
-            self.update_game()
-            self.run_ai_turn()
+            self.start_frame_loop()
     
     def restart_game(self):
         """Redémarre le jeu"""
-        # Réinitialise les plateaux
-        self.human_board = Board(width=10, height=20)
-        self.ai_board = Board(width=10, height=20)
-        
-        # CORRECTION: Réinitialise l'IA avec le nouveau plateau
-        self.ai = AI(self.ai_board)
-        
-        # Réinitialise les scores
-        self.human_score = 0
-        self.ai_score = 0
-        
-        # Réinitialise les pièces
-        self.human_current_piece = get_random_piece()
-        self.human_next_piece = get_random_piece()
-        self.ai_current_piece = get_random_piece()
-        self.ai_next_piece = get_random_piece()
-        
-        # Réinitialise les règles spéciales
-        self.rainbow_mode = False
-        self.pause_douceur_active = {"human": False, "ai": False}
-        self.last_rainbow_time = time.time()
+        # Réinitialise les plateaux, l'IA, les scores, les pièces et les règles spéciales
+        self.reset()
+        self.ai_worker.ai = self.ai
         
         # Cache l'écran de game over si nécessaire
         self.ui.hide_game_over()
         
         # Reprend le jeu
         self.game_running = True
-        self.update_game()
-        self.run_ai_turn()
+        self.start_frame_loop()
     
     def game_over(self, winner):
         """Termine la partie et affiche le gagnant"""
-        self.game_running = False
+        super().game_over(winner)
+        self.ui.update_display()
         self.ui.show_game_over(winner)
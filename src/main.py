@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import atexit
 import sys
 import os
 import customtkinter as ctk
@@ -8,13 +10,32 @@ import customtkinter as ctk
 # Ajouter le répertoire parent au chemin de recherche des modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.game import Game
+from src.game import Game, TARGET_FPS
+from src.ui import RENDERERS
+from src.profiler import profiler
 
 if __name__ == "__main__":
     """Point d'entrée principal du jeu"""
+    parser = argparse.ArgumentParser(description="Tetris à deux joueurs (Humain vs IA)")
+    parser.add_argument("--profile", nargs="?", const="profile.csv", default=None, metavar="CSV",
+                        help="active le profileur (F3 pour l'afficher) et écrit ses mesures "
+                             "dans un CSV à la fermeture (par défaut profile.csv)")
+    parser.add_argument("--fps", type=int, default=TARGET_FPS,
+                        help=f"cadence visée de l'affichage en images par seconde (par défaut {TARGET_FPS})")
+    parser.add_argument("--renderer", choices=sorted(RENDERERS), default="tiles",
+                        help="rendu des cellules : une image par cellule (tiles, par défaut) "
+                             "ou six éléments graphiques par cellule (items)")
+    args = parser.parse_args()
+    if args.fps < 1:
+        parser.error("--fps doit être au moins 1")
+    
+    if args.profile:
+        profiler.enable()
+        atexit.register(profiler.dump_csv, args.profile)
+    
     # Initialiser CustomTkinter
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
     
-    game = Game(use_custom_tkinter=True)
+    game = Game(use_custom_tkinter=True, target_fps=args.fps, renderer=args.renderer)
     game.start()
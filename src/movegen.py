@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Génération des placements atteignables pour l'IA
+Explore en largeur les états (x, y, rotation) d'une pièce depuis sa position
+d'apparition, avec les mêmes règles de déplacement que le jeu
+"""
+
+from collections import deque, namedtuple
+from src.pieces import ROTATIONS, ROTATION_COUNTS
+from src.transposition import TranspositionTable
+
+# Placement final d'une pièce et suite de mouvements pour l'atteindre
+Placement = namedtuple("Placement", ["rotation", "x", "y", "path"])
+
+# Mouvements du jeu : (nom, dx, dy, rotation ajoutée)
+MOVES = (
+    ("left", -1, 0, 0),
+    ("right", 1, 0, 0),
+    ("down", 0, 1, 0),
+    ("rotate", 0, 0, 1),
+)
+
+class MoveGenerator:
+    """Générateur des placements atteignables depuis la position d'apparition"""
+    
+    def __init__(self, cache_size=20000):
+        """Initialise le générateur
+        
+        Args:
+            cache_size: Nombre maximal de résultats mémorisés
+        """
+        # Résultats mémorisés par (hash du plateau, pièce, position de départ)
+        self.cache = TranspositionTable(cache_size)
+    
+    def generate(self, board, piece):
+        """Retourne tous les placements finaux distincts atteignables par une pièce
+        
+        Un placement est final quand la pièce ne peut plus descendre. Les placements
+        sous un surplomb (glissements, rotations sous un bloc) sont inclus, et chacun
+        est accompagné de la suite de mouvements qui y mène.
+        
+        Args:
+            board: Plateau de jeu
+            piece: Pièce à sa position d'apparition
+        
+        Returns:
+            tuple: Placements (Placement) atteignables, dans l'ordre de découverte
+        """
+        rotation = piece.rotation % ROTATION_COUNTS[piece.type]
+        key = (board.hash, piece.type, piece.x, piece.y, rotation)
+        
+        placements = self.cache.get(key)
+        if placements is None:
+            placements = self._search(board, piece.type, rotation, piece.x, piece.y)
+            self.cache.put(key, placements)
+        return placements
+    
+    def get_path(self, board, piece, rotation, x, y):
+        """Retourne la suite de mouvements menant à un placement
+        
+        Args:
+            board: Plateau de jeu
+            piece: Pièce à sa position d'apparition
+            rotation, x, y: Placement visé
+        
+        Returns:
+            list: Mouvements ("left", "right", "down", "rotate") ou None si inaccessible
+        """
+        for placement in self.generate(board, piece):
+            if (placement.rotation, placement.x, placement.y) == (rotation, x, y):
+                return list(placement.path)
+        return None
+    
+    def _search(self, board, piece_type, rotation, start_x, start_y):
+        """Parcours en largeur des états de la pièce
+        
+        Les états visités sont marqués dans un tableau de bits compact indexé par
+        (rotation, y, x).
+        
+        Args:
+            board: Plateau de jeu
+            piece_type: Type de la pièce
+            rotation, start_x, start_y: État de départ
+        
+        Returns:
+            tuple: Placements (Placement) atteignables
+        """
+        rotation_count = ROTATION_COUNTS[piece_type]
+        infos = [ROTATIONS[(piece_type, r)] for r in range(rotation_count)]
+        
+        if not board.fits(infos[rotation], start_x, start_y, allow_above=True):
+            return ()
+        
+        # Dimensions de l'espace des états (la pièce ne remonte jamais)
+        min_x = min(-info.left for info in infos)
+        span_x = board.width - min_x
+        span_y = board.height - start_y
+        visited = bytearray((rotation_count * span_y * span_x + 7) // 8)
+        
+        def index(r, x, y):
+            return (r * span_y + (y - start_y)) * span_x + (x - min_x)
+        
+        start = index(rotation, start_x, start_y)
+        visited[start >> 3] |= 1 << (start & 7)
+        parents = {start: None}
+        
+        queue = deque([(rotation, start_x, start_y, start)])
+        finals = []
+        
+        while queue:
+            r, x, y, state = queue.popleft()
+            
+            for name, dx, dy, dr in MOVES:
+                new_r = (r + dr) % rotation_count
+                new_x = x + dx
+                new_y = y + dy
+                
+                if not board.fits(infos[new_r], new_x, new_y, allow_above=True):
+                    # La pièce ne peut plus descendre : placement final
+                    if name == "down" and y + infos[r].top >= 0:
+                        finals.append((r, x, y, state))
+                    continue
+                
+                new_state = index(new_r, new_x, new_y)
+                if visited[new_state >> 3] & (1 << (new_state & 7)):
+                    continue
+                
+                visited[new_state >> 3] |= 1 << (new_state & 7)
+                parents[new_state] = (state, name)
+                queue.append((new_r, new_x, new_y, new_state))
+        
+        return tuple(
+            Placement(r, x, y, self._build_path(parents, state))
+            for r, x, y, state in finals
+        )
+    
+    def _build_path(self, parents, state):
+        """Reconstruit la suite de mouvements menant à un état
+        
+        Args:
+            parents: Parent et mouvement de chaque état visité
+            state: État final
+        
+        Returns:
+            tuple: Mouvements depuis l'état de départ
+        """
+        path = []
+        while parents[state] is not None:
+            state, name = parents[state]
+            path.append(name)
+        path.reverse()
+        return tuple(path)
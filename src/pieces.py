@@ -6,6 +6,7 @@ Classes représentant les différentes pièces de Tetris
 """
 
 import random
+from collections import deque, namedtuple
 from enum import Enum, auto
 
 class PieceType(Enum):
@@ -20,6 +21,36 @@ class PieceType(Enum):
     HEART = auto()  # Cœur (pièce spéciale)
     STAR = auto()  # Étoile (pièce spéciale)
 
+# Couleur de chaque type de pièce
+PIECE_COLORS = {
+    PieceType.I: "#00FFFF",  # Cyan
+    PieceType.J: "#0000FF",  # Bleu
+    PieceType.L: "#FF8000",  # Orange
+    PieceType.O: "#FFFF00",  # Jaune
+    PieceType.S: "#00FF00",  # Vert
+    PieceType.T: "#8000FF",  # Violet
+    PieceType.Z: "#FF0000",  # Rouge
+    PieceType.HEART: "#FF00FF",  # Rose
+    PieceType.STAR: "#FFFFFF",  # Blanc
+}
+
+# Groupes de pièces tirées au hasard
+STANDARD_TYPES = (PieceType.I, PieceType.J, PieceType.L, PieceType.O, PieceType.S, PieceType.T, PieceType.Z)
+EASY_TYPES = (PieceType.I, PieceType.O)
+SPECIAL_TYPES = (PieceType.HEART, PieceType.STAR)
+
+# Informations précalculées d'une rotation (immuables)
+# - shape : forme sous forme de tuple de tuples
+# - cells : décalages (x, y) des cellules occupées
+# - masks : masques binaires (y, masque) des lignes occupées (bit i = colonne i)
+# - left, top, right, bottom : boîte englobante des cellules occupées
+# - skirt : plus grand y occupé de chaque colonne de left à right (profil du bas)
+# - crown : plus petit y occupé de chaque colonne de left à right (profil du haut)
+RotationInfo = namedtuple(
+    "RotationInfo",
+    ["shape", "cells", "masks", "left", "top", "right", "bottom", "skirt", "crown"]
+)
+
 class Piece:
     """Classe de base pour les pièces Tetris"""
     
@@ -30,30 +61,30 @@ class Piece:
             piece_type: Type de la pièce (PieceType)
         """
         self.type = piece_type
+        self.reset()
+        self.color = self._get_color()
+    
+    def reset(self):
+        """Replace la pièce à sa position d'apparition"""
         self.x = 3  # Position initiale en x
         self.y = 0  # Position initiale en y
         self.rotation = 0  # Rotation initiale
-        self.color = self._get_color()
     
     def _get_color(self):
         """Retourne la couleur de la pièce en fonction de son type"""
-        colors = {
-            PieceType.I: "#00FFFF",  # Cyan
-            PieceType.J: "#0000FF",  # Bleu
-            PieceType.L: "#FF8000",  # Orange
-            PieceType.O: "#FFFF00",  # Jaune
-            PieceType.S: "#00FF00",  # Vert
-            PieceType.T: "#8000FF",  # Violet
-            PieceType.Z: "#FF0000",  # Rouge
-            PieceType.HEART: "#FF00FF",  # Rose
-            PieceType.STAR: "#FFFFFF",  # Blanc
-        }
-        return colors.get(self.type, "#888888")
+        return PIECE_COLORS.get(self.type, "#888888")
     
     def get_shape(self):
         """Retourne la forme de la pièce en fonction de sa rotation"""
-        shapes = self._get_shapes()
-        return shapes[self.rotation % len(shapes)]
+        return self.get_rotation_info().shape
+    
+    def get_rotation_info(self):
+        """Retourne les informations précalculées de la rotation actuelle
+        
+        Returns:
+            RotationInfo: Entrée de la table ROTATIONS pour cette pièce
+        """
+        return ROTATIONS[(self.type, self.rotation % ROTATION_COUNTS[self.type])]
     
     def _get_shapes(self):
         """Retourne toutes les formes possibles de la pièce"""
@@ -62,8 +93,7 @@ class Piece:
     
     def rotate(self):
         """Fait pivoter la pièce"""
-        shapes = self._get_shapes()
-        self.rotation = (self.rotation + 1) % len(shapes)
+        self.rotation = (self.rotation + 1) % ROTATION_COUNTS[self.type]
 
 class IPiece(Piece):
     """Pièce en forme de I (ligne)"""
@@ -265,19 +295,198 @@ class StarPiece(Piece):
             ]
         ]
 
-def get_random_piece(only_easy=False, special=False):
+def _build_rotation_info(shape):
+    """Construit les informations précalculées d'une forme
+    
+    Args:
+        shape: Forme de la pièce (liste de lignes de 0/1)
+    
+    Returns:
+        RotationInfo: Informations immuables de la forme
+    """
+    cells = tuple(
+        (x_offset, y_offset)
+        for y_offset, row in enumerate(shape)
+        for x_offset, cell in enumerate(row)
+        if cell
+    )
+    masks = tuple(
+        (y_offset, sum(1 << x_offset for x_offset, cell in enumerate(row) if cell))
+        for y_offset, row in enumerate(shape)
+        if any(row)
+    )
+    xs = [x for x, _ in cells]
+    ys = [y for _, y in cells]
+    left, right = min(xs), max(xs)
+    
+    # Profils du bas et du haut de chaque colonne de la boîte englobante
+    skirt = tuple(max(y for x, y in cells if x == column) for column in range(left, right + 1))
+    crown = tuple(min(y for x, y in cells if x == column) for column in range(left, right + 1))
+    
+    return RotationInfo(
+        shape=tuple(tuple(row) for row in shape),
+        cells=cells,
+        masks=masks,
+        left=left,
+        top=min(ys),
+        right=right,
+        bottom=max(ys),
+        skirt=skirt,
+        crown=crown,
+    )
+
+def _build_rotation_table():
+    """Construit la table des rotations de toutes les pièces
+    
+    Returns:
+        tuple: (table {(PieceType, rotation): RotationInfo}, {PieceType: nombre de rotations})
+    """
+    table = {}
+    counts = {}
+    for piece_class in PIECE_CLASSES.values():
+        piece = piece_class()
+        shapes = piece._get_shapes()
+        counts[piece.type] = len(shapes)
+        for rotation, shape in enumerate(shapes):
+            table[(piece.type, rotation)] = _build_rotation_info(shape)
+    return table, counts
+
+# Classe associée à chaque type de pièce
+PIECE_CLASSES = {
+    PieceType.I: IPiece,
+    PieceType.J: JPiece,
+    PieceType.L: LPiece,
+    PieceType.O: OPiece,
+    PieceType.S: SPiece,
+    PieceType.T: TPiece,
+    PieceType.Z: ZPiece,
+    PieceType.HEART: HeartPiece,
+    PieceType.STAR: StarPiece,
+}
+
+# Table des rotations, construite une seule fois à l'import
+ROTATIONS, ROTATION_COUNTS = _build_rotation_table()
+
+def get_random_piece(only_easy=False, special=False, rng=None):
     """Retourne une pièce aléatoire
     
+    Seule la pièce tirée est construite.
+    
     Args:
         only_easy (bool): Si True, ne retourne que des pièces faciles (I et O)
         special (bool): Si True, ne retourne que des pièces spéciales (cœur et étoile)
+        rng (random.Random): Générateur aléatoire à utiliser (par défaut, le module random)
     
     Returns:
         Piece: Une pièce aléatoire
     """
+    rng = rng or random
     if special:
-        return random.choice([HeartPiece(), StarPiece()])
+        types = SPECIAL_TYPES
     elif only_easy:
-        return random.choice([IPiece(), OPiece()])
+        types = EASY_TYPES
     else:
-        return random.choice([IPiece(), JPiece(), LPiece(), OPiece(), SPiece(), TPiece(), ZPiece()])
+        types = STANDARD_TYPES
+    return PIECE_CLASSES[rng.choice(types)]()
+
+class PieceStream:
+    """Flux de pièces d'un joueur
+    
+    Les pièces sont tirées avec un générateur aléatoire qui lui est propre (la suite
+    est reproductible si une graine est fournie), uniformément ou par sacs de sept
+    pièces. Une file d'aperçu garde les prochaines pièces déjà tirées, et les pièces
+    rendues avec release sont réutilisées au lieu d'en construire de nouvelles.
+    """
+    
+    def __init__(self, seed=None, bag=False, preview=1):
+        """Initialise le flux
+        
+        Args:
+            seed: Graine du générateur (None = graine aléatoire)
+            bag: Si True, tire les pièces par sacs contenant chacune des sept pièces
+            preview: Nombre de pièces à venir consultables avec peek
+        """
+        self.rng = random.Random(seed)
+        self.bag = bag
+        self.preview = max(1, preview)
+        
+        self._bag = []
+        self._queue = deque()
+        self._pool = {piece_type: [] for piece_type in PIECE_CLASSES}
+        self._fill()
+    
+    def next(self):
+        """Retourne la prochaine pièce du flux, à sa position d'apparition
+        
+        Returns:
+            Piece: Prochaine pièce
+        """
+        piece = self._queue.popleft()
+        self._fill()
+        return piece
+    
+    def peek(self, count=None):
+        """Retourne les prochaines pièces sans les retirer du flux
+        
+        Args:
+            count: Nombre de pièces (au plus preview, par défaut toutes)
+        
+        Returns:
+            list: Prochaines pièces, de la plus proche à la plus lointaine
+        """
+        count = self.preview if count is None else min(count, self.preview)
+        return [self._queue[i] for i in range(count)]
+    
+    def draw(self, types):
+        """Tire une pièce parmi certains types, hors de la suite normale
+        
+        Utilisé par les règles spéciales (pièces faciles ou rigolotes) : le sac
+        et la file d'aperçu ne sont pas modifiés.
+        
+        Args:
+            types: Types possibles (par exemple EASY_TYPES ou SPECIAL_TYPES)
+        
+        Returns:
+            Piece: Pièce tirée, à sa position d'apparition
+        """
+        return self._acquire(self.rng.choice(types))
+    
+    def release(self, piece):
+        """Rend une pièce qui n'est plus utilisée pour qu'elle soit réutilisée
+        
+        Args:
+            piece: Pièce verrouillée ou remplacée (plus aucune référence ne doit être gardée)
+        """
+        if piece is not None:
+            self._pool[piece.type].append(piece)
+    
+    def _fill(self):
+        """Complète la file d'aperçu"""
+        while len(self._queue) < self.preview:
+            self._queue.append(self._acquire(self._next_type()))
+    
+    def _next_type(self):
+        """Tire le type de la prochaine pièce de la suite normale"""
+        if not self.bag:
+            return self.rng.choice(STANDARD_TYPES)
+        
+        if not self._bag:
+            self._bag = list(STANDARD_TYPES)
+            self.rng.shuffle(self._bag)
+        return self._bag.pop()
+    
+    def _acquire(self, piece_type):
+        """Retourne une pièce d'un type donné, réutilisée si possible
+        
+        Args:
+            piece_type: Type de la pièce
+        
+        Returns:
+            Piece: Pièce à sa position d'apparition
+        """
+        pool = self._pool[piece_type]
+        if pool:
+            piece = pool.pop()
+            piece.reset()
+            return piece
+        return PIECE_CLASSES[piece_type]()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Profileur intégré de la boucle de jeu, de l'IA et de l'affichage
+Les durées sont rangées dans des histogrammes de taille fixe, consultables à
+l'écran et exportables en CSV. Désactivé, le profileur ne coûte qu'un test par
+point de mesure
+"""
+
+import bisect
+import csv
+import threading
+import time
+
+# Bornes supérieures des classes des histogrammes (ms), la dernière classe est ouverte
+BUCKET_BOUNDS = (0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+class Histogram:
+    """Histogramme de durées à classes fixes"""
+    
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        """Initialise un histogramme vide
+        
+        Args:
+            bounds: Bornes supérieures des classes (ms), par ordre croissant
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+    
+    def add(self, value):
+        """Ajoute une mesure (ms)"""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def mean(self):
+        """Retourne la moyenne des mesures (ms)"""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, fraction):
+        """Retourne une estimation d'un centile (borne supérieure de sa classe)
+        
+        Args:
+            fraction: Centile voulu entre 0 et 1 (0.95 = 95e centile)
+        
+        Returns:
+            float: Valeur estimée (ms)
+        """
+        if not self.count:
+            return 0.0
+        
+        target = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+class _Timer:
+    """Mesure la durée d'un bloc with et l'ajoute au profileur"""
+    
+    __slots__ = ("profiler", "name", "start")
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, 1000 * (time.perf_counter() - self.start))
+
+class _NullTimer:
+    """Bloc with sans effet, utilisé quand le profileur est désactivé"""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return None
+
+_NULL_TIMER = _NullTimer()
+
+class Profiler:
+    """Collecte des durées par nom de mesure"""
+    
+    def __init__(self, enabled=False):
+        """Initialise le profileur
+        
+        Args:
+            enabled: Si True, les mesures sont enregistrées
+        """
+        self.enabled = enabled
+        self.histograms = {}
+        self.deadlines = {}
+        self.lock = threading.Lock()
+    
+    def enable(self):
+        """Active les mesures"""
+        self.enabled = True
+    
+    def disable(self):
+        """Désactive les mesures (les histogrammes sont conservés)"""
+        self.enabled = False
+    
+    def reset(self):
+        """Efface toutes les mesures"""
+        with self.lock:
+            self.histograms = {}
+            self.deadlines = {}
+    
+    def timed(self, name):
+        """Retourne un bloc with qui mesure sa propre durée
+        
+        Args:
+            name: Nom de la mesure (par exemple "ui.update_display")
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+    
+    def record(self, name, value):
+        """Ajoute une mesure
+        
+        Args:
+            name: Nom de la mesure
+            value: Durée (ms)
+        """
+        if not self.enabled:
+            return
+        
+        # Les mesures peuvent venir du thread de l'IA
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(value)
+    
+    def scheduled(self, name, delay):
+        """Note qu'un rappel a été programmé (root.after) pour mesurer sa gigue
+        
+        Args:
+            name: Nom du rappel
+            delay: Délai demandé (ms)
+        """
+        if self.enabled:
+            self.deadlines[name] = time.perf_counter() + delay / 1000
+    
+    def fired(self, name):
+        """Note qu'un rappel programmé s'exécute et enregistre son retard
+        
+        Le retard par rapport au délai demandé est enregistré sous "<name>.jitter".
+        
+        Args:
+            name: Nom du rappel
+        """
+        if not self.enabled:
+            return
+        
+        deadline = self.deadlines.pop(name, None)
+        if deadline is not None:
+            self.record(f"{name}.jitter", max(0.0, 1000 * (time.perf_counter() - deadline)))
+    
+    def get_summary_lines(self):
+        """Retourne un résumé des mesures, une ligne par nom (pour l'affichage)
+        
+        Returns:
+            list: Lignes de texte
+        """
+        lines = [f"{'mesure':30s} {'n':>6s} {'moy':>7s} {'p95':>7s} {'max':>7s}"]
+        with self.lock:
+            for name in sorted(self.histograms):
+                histogram = self.histograms[name]
+                lines.append(
+                    f"{name:30s} {histogram.count:6d} {histogram.mean():7.2f} "
+                    f"{histogram.percentile(0.95):7.2f} {histogram.max:7.2f}"
+                )
+        return lines
+    
+    def dump_csv(self, path):
+        """Écrit les histogrammes dans un fichier CSV
+        
+        Args:
+            path: Chemin du fichier
+        """
+        with self.lock:
+            histograms = dict(self.histograms)
+        
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["name", "count", "mean_ms", "min_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms"]
+                + [f"le_{bound}ms" for bound in BUCKET_BOUNDS] + [f"gt_{BUCKET_BOUNDS[-1]}ms"]
+            )
+            for name in sorted(histograms):
+                histogram = histograms[name]
+                writer.writerow(
+                    [
+                        name,
+                        histogram.count,
+                        f"{histogram.mean():.4f}",
+                        f"{histogram.min if histogram.count else 0.0:.4f}",
+                        f"{histogram.max:.4f}",
+                        f"{histogram.percentile(0.5):.4f}",
+                        f"{histogram.percentile(0.95):.4f}",
+                        f"{histogram.percentile(0.99):.4f}",
+                    ]
+                    + histogram.counts
+                )
+
+# Profileur partagé par tout le jeu (désactivé par défaut)
+profiler = Profiler()
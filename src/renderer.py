@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rendu des grilles de cellules sur un canvas Tkinter en mode retenu
+Les éléments graphiques de chaque cellule sont créés une seule fois ; à chaque
+mise à jour, seules les cellules dont la couleur a changé sont reconfigurées
+"""
+
+import tkinter as tk
+
+class CellRenderer:
+    """Grille de cellules avec effet 3D dessinée sur un canvas
+    
+    Chaque cellule est composée d'un rectangle principal, de deux bords clairs
+    (haut et gauche), de deux bords sombres (bas et droite) et d'un rectangle
+    intérieur pour l'effet de profondeur. Une cellule vide est simplement masquée.
+    """
+    
+    # Étiquette commune à tous les éléments des cellules
+    TAG = "cells"
+    
+    def __init__(self, canvas, columns, rows, ui):
+        """Initialise le rendu (les éléments sont créés au premier affichage)
+        
+        Args:
+            canvas: Canvas sur lequel dessiner
+            columns: Nombre de colonnes de la grille
+            rows: Nombre de lignes de la grille
+            ui: Interface (taille des cellules et nuances de couleurs)
+        """
+        self.canvas = canvas
+        self.columns = columns
+        self.rows = rows
+        self.ui = ui
+        self.cell_size = None
+        
+        # Couleur affichée de chaque cellule (None = vide), indexée par y * columns + x
+        self.drawn = [None] * (columns * rows)
+    
+    def render(self, colors):
+        """Affiche une grille de couleurs en ne modifiant que les cellules qui ont changé
+        
+        Args:
+            colors: Couleur de chaque cellule (None = vide), indexée par y * columns + x
+        
+        Returns:
+            int: Nombre de cellules reconfigurées
+        """
+        if self.cell_size != self.ui.cell_size:
+            self.build()
+        
+        changed = 0
+        drawn = self.drawn
+        for index, color in enumerate(colors):
+            if color != drawn[index]:
+                self.paint(index, color)
+                drawn[index] = color
+                changed += 1
+        return changed
+    
+    def build(self):
+        """(Re)crée les éléments de toutes les cellules à la taille de cellule actuelle"""
+        canvas = self.canvas
+        canvas.delete(self.TAG)
+        self.cell_size = cell_size = self.ui.cell_size
+        
+        # Effet 3D simplifié adapté à des cellules plus petites
+        border_width = max(1, int(cell_size * 0.08))  # Bordure plus fine
+        padding = cell_size * 0.2
+        
+        for index in range(self.columns * self.rows):
+            y, x = divmod(index, self.columns)
+            tag = f"c{index}"
+            
+            # Calcule les coordonnées
+            x1 = x * cell_size + 1
+            y1 = y * cell_size + 1
+            x2 = (x + 1) * cell_size - 1
+            y2 = (y + 1) * cell_size - 1
+            
+            # Rectangle principal, bords clairs (haut et gauche) et sombres (bas et droite),
+            # créés masqués
+            canvas.create_rectangle(
+                x1, y1, x2, y2, outline="", state="hidden", tags=(self.TAG, tag, f"{tag}m")
+            )
+            for coords in ((x1, y1, x2, y1), (x1, y1, x1, y2)):
+                canvas.create_line(
+                    *coords, width=border_width, state="hidden", tags=(self.TAG, tag, f"{tag}l")
+                )
+            for coords in ((x1, y2, x2, y2), (x2, y1, x2, y2)):
+                canvas.create_line(
+                    *coords, width=border_width, state="hidden", tags=(self.TAG, tag, f"{tag}d")
+                )
+            
+            # Effet de profondeur seulement pour les cellules assez grandes
+            if cell_size > 14:
+                canvas.create_rectangle(
+                    x1 + padding, y1 + padding, x2 - padding, y2 - padding,
+                    outline="", state="hidden", tags=(self.TAG, tag, f"{tag}i")
+                )
+        
+        # Les éléments viennent d'être créés masqués : tout est à repeindre
+        self.drawn = [None] * (self.columns * self.rows)
+    
+    def paint(self, index, color):
+        """Reconfigure les éléments d'une cellule
+        
+        Args:
+            index: Indice de la cellule (y * columns + x)
+            color: Nouvelle couleur (None = cellule vide)
+        """
+        canvas = self.canvas
+        tag = f"c{index}"
+        if color is None:
+            canvas.itemconfigure(tag, state="hidden")
+            return
+        
+        light, dark, inner = self.ui.get_shades(color)
+        canvas.itemconfigure(f"{tag}m", fill=color, state="normal")
+        canvas.itemconfigure(f"{tag}l", fill=light, state="normal")
+        canvas.itemconfigure(f"{tag}d", fill=dark, state="normal")
+        canvas.itemconfigure(f"{tag}i", fill=inner, state="normal")
+    
+    def invalidate(self):
+        """Force la reconstruction des éléments au prochain affichage"""
+        self.cell_size = None
+
+class TileRenderer(CellRenderer):
+    """Grille de cellules dessinées chacune par une seule image
+    
+    L'effet 3D de chaque couleur est précalculé dans une tuile PhotoImage
+    (voir create_tile), partagée par toutes les cellules de cette couleur :
+    une cellule n'est plus qu'un élément image au lieu de six éléments.
+    """
+    
+    def __init__(self, canvas, columns, rows, ui):
+        """Initialise le rendu (les éléments sont créés au premier affichage)
+        
+        Args:
+            canvas: Canvas sur lequel dessiner
+            columns: Nombre de colonnes de la grille
+            rows: Nombre de lignes de la grille
+            ui: Interface (taille des cellules et cache des tuiles)
+        """
+        super().__init__(canvas, columns, rows, ui)
+        
+        # Tuile affichée par chaque cellule : garde l'image en vie même si elle
+        # sort du cache des tuiles de l'interface
+        self.images = [None] * (columns * rows)
+    
+    def build(self):
+        """(Re)crée l'élément image de chaque cellule à la taille de cellule actuelle"""
+        canvas = self.canvas
+        canvas.delete(self.TAG)
+        self.cell_size = cell_size = self.ui.cell_size
+        
+        for index in range(self.columns * self.rows):
+            y, x = divmod(index, self.columns)
+            canvas.create_image(
+                x * cell_size + 1, y * cell_size + 1, anchor="nw",
+                state="hidden", tags=(self.TAG, f"c{index}")
+            )
+        
+        # Les éléments viennent d'être créés masqués : tout est à repeindre
+        self.drawn = [None] * (self.columns * self.rows)
+        self.images = [None] * (self.columns * self.rows)
+    
+    def paint(self, index, color):
+        """Change la tuile affichée par une cellule
+        
+        Args:
+            index: Indice de la cellule (y * columns + x)
+            color: Nouvelle couleur (None = cellule vide)
+        """
+        if color is None:
+            self.canvas.itemconfigure(f"c{index}", state="hidden")
+            self.images[index] = None
+            return
+        
+        tile = self.images[index] = self.ui.get_tile(color)
+        self.canvas.itemconfigure(f"c{index}", image=tile, state="normal")
+
+class PieceOverlay:
+    """Pièce en chute dessinée par-dessus la grille, à une position au pixel près
+    
+    Les cellules de la pièce sont des images (tuiles de l'interface) créées
+    quand la forme change ; un déplacement ne fait que décaler ces éléments.
+    """
+    
+    # Étiquette commune aux éléments de la pièce
+    TAG = "piece"
+    
+    def __init__(self, canvas, ui):
+        """Initialise la pièce (les éléments sont créés au premier affichage)
+        
+        Args:
+            canvas: Canvas sur lequel dessiner
+            ui: Interface (taille des cellules et cache des tuiles)
+        """
+        self.canvas = canvas
+        self.ui = ui
+        
+        # Forme (cellules et taille des cellules), couleur, tuile et position affichées
+        self.shape = None
+        self.color = None
+        self.tile = None
+        self.position = None
+    
+    def render(self, cells, color, x, y):
+        """Affiche la pièce
+        
+        Args:
+            cells: Positions (x, y) des cellules de la pièce, relatives à son origine
+            color: Couleur de la pièce
+            x, y: Position de l'origine de la pièce sur le canvas (pixels)
+        """
+        canvas = self.canvas
+        cell_size = self.ui.cell_size
+        shape = (cells, cell_size)
+        
+        # Nouvelle forme (ou nouvelle taille) : recrée les éléments
+        if shape != self.shape:
+            canvas.delete(self.TAG)
+            self.tile = self.ui.get_tile(color)
+            for dx, dy in cells:
+                canvas.create_image(
+                    x + dx * cell_size + 1, y + dy * cell_size + 1, anchor="nw",
+                    image=self.tile, tags=self.TAG
+                )
+            self.shape, self.color, self.position = shape, color, (x, y)
+            return
+        
+        if color != self.color:
+            self.tile = self.ui.get_tile(color)
+            canvas.itemconfigure(self.TAG, image=self.tile)
+            self.color = color
+        
+        if (x, y) != self.position:
+            canvas.move(self.TAG, x - self.position[0], y - self.position[1])
+            self.position = (x, y)
+    
+    def hide(self):
+        """Efface la pièce"""
+        if self.shape is not None:
+            self.canvas.delete(self.TAG)
+            self.shape = None
+
+def create_tile(master, cell_size, color, shades):
+    """Dessine l'effet 3D d'une cellule dans une image
+    
+    Reproduit le dessin de CellRenderer : fond, bords clairs en haut et à
+    gauche, bords sombres en bas et à droite, et rectangle intérieur pour les
+    cellules assez grandes. L'image laisse un pixel libre pour la grille.
+    
+    Args:
+        master: Widget Tkinter propriétaire de l'image
+        cell_size: Taille des cellules (pixels)
+        color: Couleur de base au format hexadécimal
+        shades: Nuances claire, sombre et intérieure de la couleur
+    
+    Returns:
+        tk.PhotoImage: Tuile de la cellule
+    """
+    light, dark, inner = shades
+    size = max(1, int(cell_size) - 1)
+    border_width = min(size, max(1, int(cell_size * 0.08)))
+    
+    tile = tk.PhotoImage(master=master, width=size, height=size)
+    tile.put(color, to=(0, 0, size, size))
+    
+    # Bords clairs (haut et gauche) puis sombres (bas et droite)
+    tile.put(light, to=(0, 0, size, border_width))
+    tile.put(light, to=(0, 0, border_width, size))
+    tile.put(dark, to=(0, size - border_width, size, size))
+    tile.put(dark, to=(size - border_width, 0, size, size))
+    
+    # Effet de profondeur seulement pour les cellules assez grandes
+    padding = int(cell_size * 0.2)
+    if cell_size > 14 and size - 2 * padding > 0:
+        tile.put(inner, to=(padding, padding, size - padding, size - padding))
+    
+    return tile
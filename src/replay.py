@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Format binaire compact des replays de parties
+Chaque pièce verrouillée est enregistrée sur quelques octets, et l'état complet
+des deux plateaux est enregistré toutes les N pièces (images clés) avec un index,
+ce qui permet de retrouver n'importe quel coup sans rejouer toute la partie
+
+Structure du fichier :
+- en-tête : HEADER
+- blocs : une image clé (KEYFRAME puis les deux grilles) suivie d'au plus
+  keyframe_interval coups (MOVE)
+- index : position de chaque image clé dans le fichier (entiers sur 64 bits)
+- pied : FOOTER
+"""
+
+import mmap
+import struct
+from collections import namedtuple
+from src.board import Board
+from src.pieces import PieceType, PIECE_COLORS, PIECE_CLASSES
+from src.engine import PLAYERS, LINE_SCORES
+
+# Formats binaires (petit-boutiste, sans alignement)
+MAGIC = b"TTRP"
+FOOTER_MAGIC = b"TTRX"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBH")   # magie, version, largeur, hauteur, intervalle des images clés
+MOVE = struct.Struct("<BBBbbBI")    # joueur, type, rotation, x, y, lignes, temps (ms)
+KEYFRAME = struct.Struct("<II")     # score humain, score IA (suivis des deux grilles)
+INDEX_ENTRY = struct.Struct("<Q")   # position d'une image clé
+FOOTER = struct.Struct("<QII4s")    # position de l'index, nombre de coups, d'images clés, magie
+
+# Codes des cellules dans les grilles des images clés (0 = vide)
+COLOR_CODES = {color: piece_type.value for piece_type, color in PIECE_COLORS.items()}
+CODE_COLORS = {piece_type.value: color for piece_type, color in PIECE_COLORS.items()}
+
+# Coup lu dans un replay
+Move = namedtuple("Move", ["player", "piece_type", "rotation", "x", "y", "lines", "time_ms"])
+
+class ReplayWriter:
+    """Écriture d'un replay au fil de la partie"""
+    
+    def __init__(self, path, width=10, height=20, keyframe_interval=64):
+        """Crée le fichier de replay et écrit l'image clé de départ (plateaux vides)
+        
+        Args:
+            path: Chemin du fichier
+            width: Largeur des plateaux
+            height: Hauteur des plateaux
+            keyframe_interval: Nombre de coups entre deux images clés (de 1 à 65535)
+        
+        Raises:
+            ValueError: Si keyframe_interval est hors limites
+        """
+        if not 1 <= keyframe_interval <= 0xFFFF:
+            raise ValueError(f"keyframe_interval doit être compris entre 1 et 65535 (reçu {keyframe_interval})")
+        
+        self.width = width
+        self.height = height
+        self.keyframe_interval = keyframe_interval
+        self.move_count = 0
+        self.keyframe_offsets = []
+        
+        self.file = open(path, "wb")
+        self.offset = 0
+        self._write(HEADER.pack(MAGIC, VERSION, width, height, keyframe_interval))
+        
+        empty = Board(width, height)
+        self.write_keyframe(empty, empty, 0, 0)
+    
+    def record(self, player, piece, lines, time_ms):
+        """Enregistre une pièce verrouillée
+        
+        Args:
+            player: Joueur ("human" ou "ai")
+            piece: Pièce à sa position de verrouillage
+            lines: Nombre de lignes effacées
+            time_ms: Instant du verrouillage depuis le début de la partie (ms)
+        """
+        self._write(MOVE.pack(
+            PLAYERS.index(player), piece.type.value, piece.rotation,
+            piece.x, piece.y, lines, int(time_ms),
+        ))
+        self.move_count += 1
+    
+    def keyframe_due(self):
+        """Indique si une image clé doit être écrite après le dernier coup"""
+        return self.move_count % self.keyframe_interval == 0
+    
+    def write_keyframe(self, human_board, ai_board, human_score, ai_score):
+        """Enregistre l'état complet des deux plateaux
+        
+        Args:
+            human_board, ai_board: Plateaux après le dernier coup enregistré
+            human_score, ai_score: Scores après le dernier coup enregistré
+        """
+        self.keyframe_offsets.append(self.offset)
+        self._write(KEYFRAME.pack(human_score, ai_score))
+        for board in (human_board, ai_board):
+            self._write(bytes(
+                COLOR_CODES.get(cell, 0)
+                for row in board.grid
+                for cell in row
+            ))
+    
+    def close(self):
+        """Écrit l'index et le pied puis ferme le fichier"""
+        if self.file.closed:
+            return
+        
+        index_offset = self.offset
+        for keyframe_offset in self.keyframe_offsets:
+            self._write(INDEX_ENTRY.pack(keyframe_offset))
+        self._write(FOOTER.pack(index_offset, self.move_count, len(self.keyframe_offsets), FOOTER_MAGIC))
+        self.file.close()
+    
+    def _write(self, data):
+        """Écrit des octets à la suite du fichier"""
+        self.file.write(data)
+        self.offset += len(data)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ReplayReader:
+    """Lecture d'un replay projeté en mémoire (mmap)"""
+    
+    def __init__(self, path):
+        """Ouvre un replay terminé
+        
+        Args:
+            path: Chemin du fichier
+        
+        Raises:
+            ValueError: Si le fichier n'est pas un replay complet
+        """
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"{path} : fichier vide")
+        
+        magic, version, self.width, self.height, self.keyframe_interval = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION or len(self.data) < HEADER.size + FOOTER.size:
+            self.close()
+            raise ValueError(f"{path} : format de replay inconnu")
+        
+        index_offset, self.move_count, self.keyframe_count, footer_magic = FOOTER.unpack_from(
+            self.data, len(self.data) - FOOTER.size
+        )
+        if footer_magic != FOOTER_MAGIC:
+            self.close()
+            raise ValueError(f"{path} : replay incomplet (fichier non fermé)")
+        
+        self.index_offset = index_offset
+        self.cells = self.width * self.height
+        self.keyframe_size = KEYFRAME.size + 2 * self.cells
+    
+    def __len__(self):
+        """Retourne le nombre de coups du replay"""
+        return self.move_count
+    
+    def get_move(self, number):
+        """Retourne un coup en temps constant
+        
+        Args:
+            number: Numéro du coup (0 = premier)
+        
+        Returns:
+            Move: Coup enregistré
+        """
+        if not 0 <= number < self.move_count:
+            raise IndexError(f"coup {number} hors du replay ({self.move_count} coups)")
+        
+        keyframe, position = divmod(number, self.keyframe_interval)
+        offset = self._get_keyframe_offset(keyframe) + self.keyframe_size + position * MOVE.size
+        player, type_value, rotation, x, y, lines, time_ms = MOVE.unpack_from(self.data, offset)
+        return Move(PLAYERS[player], PieceType(type_value), rotation, x, y, lines, time_ms)
+    
+    def get_state(self, number):
+        """Retourne l'état de la partie après un nombre de coups donné
+        
+        L'état est reconstruit depuis l'image clé précédente, suivie d'au plus
+        keyframe_interval - 1 coups rejoués.
+        
+        Args:
+            number: Nombre de coups joués (de 0 à len(replay))
+        
+        Returns:
+            dict: Plateaux ("boards") et scores ("scores") de chaque joueur
+        """
+        if not 0 <= number <= self.move_count:
+            raise IndexError(f"état {number} hors du replay ({self.move_count} coups)")
+        
+        keyframe = number // self.keyframe_interval
+        offset = self._get_keyframe_offset(keyframe)
+        human_score, ai_score = KEYFRAME.unpack_from(self.data, offset)
+        scores = {"human": human_score, "ai": ai_score}
+        
+        boards = {}
+        grid_offset = offset + KEYFRAME.size
+        for player in PLAYERS:
+            cells = self.data[grid_offset:grid_offset + self.cells]
+            grid = [
+                [CODE_COLORS.get(code, 0) for code in cells[y * self.width:(y + 1) * self.width]]
+                for y in range(self.height)
+            ]
+            boards[player] = Board(self.width, self.height)
+            boards[player].set_grid(grid)
+            grid_offset += self.cells
+        
+        # Rejoue les coups depuis l'image clé
+        for move_number in range(keyframe * self.keyframe_interval, number):
+            move = self.get_move(move_number)
+            piece = PIECE_CLASSES[move.piece_type]()
+            piece.rotation, piece.x, piece.y = move.rotation, move.x, move.y
+            boards[move.player].add_piece(piece)
+            scores[move.player] += LINE_SCORES.get(move.lines, 0)
+        
+        return {"boards": boards, "scores": scores}
+    
+    def _get_keyframe_offset(self, keyframe):
+        """Retourne la position d'une image clé d'après l'index"""
+        (offset,) = INDEX_ENTRY.unpack_from(self.data, self.index_offset + keyframe * INDEX_ENTRY.size)
+        return offset
+    
+    def close(self):
+        """Ferme le replay"""
+        if getattr(self, "data", None) is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
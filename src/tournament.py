@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tournoi IA contre IA sans interface
+Joue N parties en parallèle sur tous les cœurs avec un pool de processus,
+affiche le résultat de chaque partie dès qu'elle se termine puis le débit global
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.engine import GameEngine, SimulatedClock
+from src.replay import ReplayWriter
+from src.batch_eval import numpy_available
+
+def play_game(args):
+    """Joue une partie IA contre IA complète
+    
+    Args:
+        args: Tuple (numéro de la partie, graine, nombre maximal de pièces, tirage par sacs,
+              options de l'IA, dossier des replays ou None)
+    
+    Returns:
+        dict: Résultat de la partie (gagnant, scores, pièces, lignes, latences)
+    """
+    index, seed, max_pieces, bag, ai_options, replay_dir = args
+    
+    # Chaque partie a sa propre graine : les résultats sont reproductibles,
+    # et les deux joueurs reçoivent la même suite de pièces
+    random.seed(seed)
+    
+    # Sans limite de temps, la recherche de l'IA ne dépend pas de la charge de
+    # la machine : seule la graine détermine la partie
+    ai_options = {"time_budget": float("inf"), **ai_options}
+    
+    replay = None
+    if replay_dir:
+        replay = ReplayWriter(os.path.join(replay_dir, f"game_{index:06d}.tetr"))
+    
+    engine = GameEngine(
+        ai_players=("human", "ai"), clock=SimulatedClock(), ai_options=ai_options,
+        seed=seed, bag=bag, replay=replay,
+    )
+    start = time.perf_counter()
+    winner = engine.run_until_game_over(max_pieces=max_pieces)
+    duration = time.perf_counter() - start
+    
+    if replay:
+        replay.close()
+    
+    stats = engine.stats
+    decisions = sum(s["decisions"] for s in stats.values())
+    decision_time = sum(s["decision_time"] for s in stats.values())
+    
+    return {
+        "index": index,
+        "seed": seed,
+        "winner": winner,
+        "scores": {"human": engine.human_score, "ai": engine.ai_score},
+        "pieces": sum(s["pieces"] for s in stats.values()),
+        "lines": sum(s["lines"] for s in stats.values()),
+        "mean_decision_ms": 1000 * decision_time / decisions if decisions else 0.0,
+        "max_decision_ms": 1000 * max(s["max_decision_time"] for s in stats.values()),
+        "duration": duration,
+    }
+
+def format_result(result):
+    """Formate le résultat d'une partie sur une ligne"""
+    winner = result["winner"] or "limite"
+    return (
+        f"partie {result['index']:4d}  gagnant {winner:6s}  "
+        f"scores {result['scores']['human']:6d} / {result['scores']['ai']:6d}  "
+        f"pièces {result['pieces']:5d}  lignes {result['lines']:4d}  "
+        f"décision {result['mean_decision_ms']:.2f} ms (max {result['max_decision_ms']:.2f} ms)  "
+        f"durée {result['duration']:.2f} s"
+    )
+
+def run_tournament(games, workers=None, seed=0, max_pieces=1000, bag=False, ai_options=None,
+                   replay_dir=None, output=print):
+    """Joue un tournoi et affiche les résultats au fil de l'eau
+    
+    Args:
+        games: Nombre de parties
+        workers: Nombre de processus (par défaut, nombre de cœurs)
+        seed: Graine de la première partie (la partie i utilise seed + i)
+        max_pieces: Nombre maximal de pièces par joueur et par partie
+        bag: Si True, les pièces sont tirées par sacs de sept
+        ai_options: Paramètres passés à chaque IA
+        replay_dir: Dossier où enregistrer le replay de chaque partie (optionnel)
+        output: Fonction d'affichage d'une ligne
+    
+    Returns:
+        dict: Bilan du tournoi (victoires, parties/s, pièces/s)
+    """
+    workers = workers or multiprocessing.cpu_count()
+    if replay_dir:
+        os.makedirs(replay_dir, exist_ok=True)
+    tasks = [(i, seed + i, max_pieces, bag, ai_options or {}, replay_dir) for i in range(games)]
+    
+    wins = {"human": 0, "ai": 0, None: 0}
+    total_pieces = 0
+    start = time.perf_counter()
+    
+    with multiprocessing.Pool(workers) as pool:
+        # Les parties sont distribuées une à une pour équilibrer la charge
+        for result in pool.imap_unordered(play_game, tasks, chunksize=1):
+            wins[result["winner"]] += 1
+            total_pieces += result["pieces"]
+            output(format_result(result))
+    
+    elapsed = time.perf_counter() - start
+    summary = {
+        "games": games,
+        "workers": workers,
+        "wins": {"human": wins["human"], "ai": wins["ai"], "limite": wins[None]},
+        "elapsed": elapsed,
+        "games_per_second": games / elapsed if elapsed else 0.0,
+        "pieces_per_second": total_pieces / elapsed if elapsed else 0.0,
+    }
+    
+    output(
+        f"{games} parties sur {workers} processus en {elapsed:.2f} s : "
+        f"{summary['games_per_second']:.2f} parties/s, {summary['pieces_per_second']:.0f} pièces/s"
+    )
+    output(
+        f"victoires : human {wins['human']}, ai {wins['ai']}, limite atteinte {wins[None]}"
+    )
+    return summary
+
+def parse_args(argv=None):
+    """Analyse les arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Tournoi Tetris IA contre IA sans interface")
+    parser.add_argument("-n", "--games", type=int, default=100, help="nombre de parties")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="nombre de processus (par défaut, nombre de cœurs)")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--max-pieces", type=int, default=1000,
+                        help="nombre maximal de pièces par joueur et par partie")
+    parser.add_argument("--bag", action="store_true", help="tirer les pièces par sacs de sept")
+    parser.add_argument("--replay-dir", default=None,
+                        help="dossier où enregistrer le replay binaire de chaque partie")
+    parser.add_argument("--depth", type=int, default=2,
+                        help="profondeur de recherche de l'IA, en pièces : la pièce en cours, "
+                             "la suivante puis l'aperçu du flux")
+    parser.add_argument("--beam", type=int, default=4, help="largeur du faisceau de l'IA")
+    parser.add_argument("--reachable", action="store_true",
+                        help="ne considérer que les placements atteignables")
+    parser.add_argument("--numpy", action="store_true",
+                        help="évaluer les placements de l'IA par lots avec NumPy")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("--depth doit être au moins 1")
+    if args.numpy and not numpy_available():
+        parser.error("--numpy nécessite NumPy (pip install numpy)")
+    return args
+
+if __name__ == "__main__":
+    """Point d'entrée du tournoi"""
+    args = parse_args()
+    run_tournament(
+        args.games,
+        workers=args.workers,
+        seed=args.seed,
+        max_pieces=args.max_pieces,
+        bag=args.bag,
+        replay_dir=args.replay_dir,
+        ai_options={
+            "search_depth": args.depth,
+            "beam_width": args.beam,
+            "reachable_moves": args.reachable,
+            "use_numpy": args.numpy,
+        },
+    )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Table de transposition pour l'IA
+Mémorise les évaluations et les résultats de recherche par hash de plateau
+"""
+
+from collections import OrderedDict
+
+class TranspositionTable:
+    """Cache borné des évaluations de l'IA, avec éviction LRU"""
+    
+    def __init__(self, max_size=200000):
+        """Initialise une table vide
+        
+        Args:
+            max_size: Nombre maximal d'entrées (0 pour désactiver le cache)
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        
+        # Compteurs pour dimensionner la table
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        """Retourne la valeur associée à une clé
+        
+        Args:
+            key: Clé recherchée (hash de plateau ou tuple le contenant)
+        
+        Returns:
+            La valeur mémorisée, ou None si la clé est absente
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        
+        # L'entrée devient la plus récemment utilisée
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        """Mémorise une valeur, en évinçant l'entrée la moins récemment utilisée si besoin
+        
+        Args:
+            key: Clé de l'entrée
+            value: Valeur à mémoriser (non None)
+        """
+        if self.max_size <= 0:
+            return
+        
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Vide la table et remet les compteurs à zéro"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_stats(self):
+        """Retourne les statistiques d'utilisation de la table
+        
+        Returns:
+            dict: Taille, capacité, succès, échecs, évictions et taux de succès
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
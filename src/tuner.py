@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Réglage automatique des paramètres d'évaluation de l'IA
+Méthode de l'entropie croisée : à chaque génération, des jeux de paramètres sont
+tirés autour de la moyenne courante, évalués sur des parties sans interface jouées
+en parallèle, puis la distribution est recentrée sur les meilleurs
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.engine import GameEngine, SimulatedClock
+from src.ai import DEFAULT_WEIGHTS
+from src.batch_eval import numpy_available
+
+# Ordre des paramètres réglés dans les vecteurs de la distribution. Le poids
+# "lines" n'est pas réglé : l'IA évalue le plateau après l'effacement des lignes
+# complètes, ce poids est donc sans effet et garde sa valeur par défaut
+WEIGHT_NAMES = tuple(name for name in DEFAULT_WEIGHTS if name != "lines")
+
+# Réglages enregistrés dans le point de reprise, qui priment sur la ligne de commande
+CHECKPOINT_SETTINGS = ("seed", "population", "elite_fraction", "games", "max_pieces", "ai_options")
+
+def simulate(weights, seed, max_pieces=500, ai_options=None):
+    """Joue une partie sans interface et retourne le nombre de lignes effacées
+    
+    La partie est une vraie partie à deux joueurs (GameEngine, règles spéciales
+    comprises), où les deux IA utilisent les paramètres évalués. La suite de
+    pièces et le hasard ne dépendent que de la graine : deux jeux de paramètres
+    évalués avec la même graine reçoivent les mêmes pièces.
+    
+    Args:
+        weights: Paramètres d'évaluation de l'IA
+        seed: Graine de la partie
+        max_pieces: Nombre maximal de pièces posées par joueur
+        ai_options: Autres paramètres passés à l'IA
+    
+    Returns:
+        int: Nombre de lignes effacées par les deux joueurs avant la fin de la partie
+    """
+    random.seed(seed)
+    
+    # Sans limite de temps, la recherche ne dépend pas de la charge de la machine
+    ai_options = {"time_budget": float("inf"), **(ai_options or {}), "weights": weights}
+    engine = GameEngine(
+        ai_players=("human", "ai"), clock=SimulatedClock(), ai_options=ai_options, seed=seed,
+    )
+    engine.run_until_game_over(max_pieces=max_pieces)
+    
+    return sum(stats["lines"] for stats in engine.stats.values())
+
+def evaluate_candidate(args):
+    """Évalue un jeu de paramètres sur une partie (fonction des processus du pool)
+    
+    Args:
+        args: Tuple (indice du candidat, paramètres, graine, nombre maximal de pièces, options)
+    
+    Returns:
+        tuple: (indice du candidat, lignes effacées)
+    """
+    index, weights, seed, max_pieces, ai_options = args
+    return index, simulate(weights, seed, max_pieces, ai_options)
+
+class CrossEntropyTuner:
+    """Optimiseur par entropie croisée des paramètres d'évaluation de l'IA"""
+    
+    def __init__(self, population=32, elite_fraction=0.25, games=8, max_pieces=500,
+                 seed=0, workers=None, ai_options=None, checkpoint=None):
+        """Initialise le réglage
+        
+        Args:
+            population: Nombre de jeux de paramètres par génération
+            elite_fraction: Proportion des meilleurs candidats gardés pour la mise à jour
+            games: Nombre de parties jouées par candidat
+            max_pieces: Nombre maximal de pièces par partie
+            seed: Graine du réglage (tirages et suites de pièces)
+            workers: Nombre de processus (par défaut, nombre de cœurs)
+            ai_options: Paramètres passés à l'IA (profondeur de recherche, ...)
+            checkpoint: Fichier JSON de point de reprise (optionnel)
+        """
+        self.population = population
+        self.elite_fraction = elite_fraction
+        self.elite_count = max(1, int(population * elite_fraction))
+        self.games = games
+        self.max_pieces = max_pieces
+        self.seed = seed
+        self.workers = workers or multiprocessing.cpu_count()
+        self.ai_options = {"search_depth": 1, **(ai_options or {})}
+        self.checkpoint = checkpoint
+        
+        # Distribution de départ centrée sur les paramètres par défaut
+        self.generation = 0
+        self.mean = [DEFAULT_WEIGHTS[name] for name in WEIGHT_NAMES]
+        self.std = [0.5] * len(WEIGHT_NAMES)
+        self.best_weights = dict(DEFAULT_WEIGHTS)
+        self.best_fitness = None
+        self.history = []
+    
+    def sample(self):
+        """Tire les candidats de la génération courante
+        
+        Le tirage ne dépend que de la graine et du numéro de génération, ce qui
+        rend une reprise identique à une exécution sans interruption.
+        
+        Returns:
+            list: Jeux de paramètres complets (dictionnaires, poids non réglés par défaut)
+        """
+        rng = random.Random(f"{self.seed}:{self.generation}")
+        return [
+            {
+                **DEFAULT_WEIGHTS,
+                **{
+                    name: rng.gauss(mean, std)
+                    for name, mean, std in zip(WEIGHT_NAMES, self.mean, self.std)
+                },
+            }
+            for _ in range(self.population)
+        ]
+    
+    def game_seeds(self):
+        """Retourne les graines des parties de la génération courante (communes à tous les candidats)"""
+        first = (self.seed * 1000003 + self.generation) * self.games
+        return [first + i for i in range(self.games)]
+    
+    def run_generation(self, pool):
+        """Évalue une génération et met à jour la distribution
+        
+        Args:
+            pool: Pool de processus
+        
+        Returns:
+            dict: Bilan de la génération
+        """
+        start = time.perf_counter()
+        candidates = self.sample()
+        tasks = [
+            (index, weights, seed, self.max_pieces, self.ai_options)
+            for index, weights in enumerate(candidates)
+            for seed in self.game_seeds()
+        ]
+        
+        totals = [0] * len(candidates)
+        for index, lines in pool.imap_unordered(evaluate_candidate, tasks, chunksize=1):
+            totals[index] += lines
+        fitness = [total / self.games for total in totals]
+        
+        # Recentre la distribution sur les meilleurs candidats
+        ranking = sorted(range(len(candidates)), key=fitness.__getitem__, reverse=True)
+        elites = [candidates[index] for index in ranking[:self.elite_count]]
+        for i, name in enumerate(WEIGHT_NAMES):
+            values = [elite[name] for elite in elites]
+            mean = sum(values) / len(values)
+            variance = sum((value - mean) ** 2 for value in values) / len(values)
+            
+            # Bruit décroissant pour éviter une convergence prématurée
+            self.mean[i] = mean
+            self.std[i] = (variance + max(0.0, 0.1 - 0.01 * self.generation) ** 2) ** 0.5
+        
+        best = ranking[0]
+        if self.best_fitness is None or fitness[best] > self.best_fitness:
+            self.best_fitness = fitness[best]
+            self.best_weights = candidates[best]
+        
+        elapsed = time.perf_counter() - start
+        report = {
+            "generation": self.generation,
+            "best_fitness": fitness[best],
+            "mean_fitness": sum(fitness) / len(fitness),
+            "games": len(tasks),
+            "elapsed": elapsed,
+        }
+        self.history.append(report)
+        self.generation += 1
+        return report
+    
+    def run(self, generations, output=print):
+        """Lance le réglage jusqu'à un nombre total de générations
+        
+        Args:
+            generations: Nombre total de générations (celles déjà faites comprises)
+            output: Fonction d'affichage d'une ligne
+        
+        Returns:
+            dict: Meilleurs paramètres trouvés
+        """
+        with multiprocessing.Pool(self.workers) as pool:
+            while self.generation < generations:
+                report = self.run_generation(pool)
+                output(
+                    f"génération {report['generation']:3d}  "
+                    f"meilleur {report['best_fitness']:8.1f} lignes  "
+                    f"moyenne {report['mean_fitness']:8.1f} lignes  "
+                    f"{report['games'] / report['elapsed']:.1f} parties/s"
+                )
+                if self.checkpoint:
+                    self.save_checkpoint(self.checkpoint)
+        
+        return self.best_weights
+    
+    def get_state(self):
+        """Retourne l'état du réglage sous une forme sérialisable en JSON"""
+        return {
+            "generation": self.generation,
+            "seed": self.seed,
+            "population": self.population,
+            "elite_fraction": self.elite_fraction,
+            "games": self.games,
+            "max_pieces": self.max_pieces,
+            "ai_options": self.ai_options,
+            "mean": dict(zip(WEIGHT_NAMES, self.mean)),
+            "std": dict(zip(WEIGHT_NAMES, self.std)),
+            "best_weights": self.best_weights,
+            "best_fitness": self.best_fitness,
+            "history": self.history,
+        }
+    
+    def set_state(self, state):
+        """Restaure l'état du réglage depuis un point de reprise"""
+        self.generation = state["generation"]
+        self.seed = state["seed"]
+        self.population = state["population"]
+        self.elite_fraction = state.get("elite_fraction", self.elite_fraction)
+        self.elite_count = max(1, int(self.population * self.elite_fraction))
+        self.games = state["games"]
+        self.max_pieces = state["max_pieces"]
+        self.ai_options = state.get("ai_options", self.ai_options)
+        self.mean = [state["mean"][name] for name in WEIGHT_NAMES]
+        self.std = [state["std"][name] for name in WEIGHT_NAMES]
+        self.best_weights = state["best_weights"]
+        self.best_fitness = state["best_fitness"]
+        self.history = state["history"]
+    
+    def save_checkpoint(self, path):
+        """Enregistre un point de reprise (écriture atomique)"""
+        save_json(path, self.get_state())
+    
+    def load_checkpoint(self, path):
+        """Reprend le réglage depuis un point de reprise"""
+        with open(path, encoding="utf-8") as f:
+            self.set_state(json.load(f))
+
+def save_json(path, data):
+    """Écrit un fichier JSON sans risquer de le laisser à moitié écrit"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, path)
+
+def parse_args(argv=None):
+    """Analyse les arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Réglage automatique des paramètres de l'IA")
+    parser.add_argument("-g", "--generations", type=int, default=20, help="nombre de générations")
+    parser.add_argument("-p", "--population", type=int, default=32, help="candidats par génération")
+    parser.add_argument("--elite", type=float, default=0.25, help="proportion de candidats gardés")
+    parser.add_argument("--games", type=int, default=8, help="parties par candidat")
+    parser.add_argument("--max-pieces", type=int, default=500, help="pièces maximales par partie")
+    parser.add_argument("--seed", type=int, default=0, help="graine du réglage")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="nombre de processus (par défaut, nombre de cœurs)")
+    parser.add_argument("--depth", type=int, default=1, help="profondeur de recherche de l'IA")
+    parser.add_argument("--numpy", action="store_true",
+                        help="évaluer les placements de l'IA par lots avec NumPy")
+    parser.add_argument("--checkpoint", default="tuner_checkpoint.json",
+                        help="point de reprise (repris automatiquement s'il existe)")
+    parser.add_argument("-o", "--output", default="weights.json",
+                        help="fichier des meilleurs paramètres (lisible par ai.load_weights)")
+    args = parser.parse_args(argv)
+    if args.numpy and not numpy_available():
+        parser.error("--numpy nécessite NumPy (pip install numpy)")
+    return args
+
+if __name__ == "__main__":
+    """Point d'entrée du réglage"""
+    args = parse_args()
+    tuner = CrossEntropyTuner(
+        population=args.population,
+        elite_fraction=args.elite,
+        games=args.games,
+        max_pieces=args.max_pieces,
+        seed=args.seed,
+        workers=args.workers,
+        ai_options={"search_depth": args.depth, "use_numpy": args.numpy},
+        checkpoint=args.checkpoint,
+    )
+    
+    if os.path.exists(args.checkpoint):
+        requested = tuner.get_state()
+        tuner.load_checkpoint(args.checkpoint)
+        print(f"reprise à la génération {tuner.generation} depuis {args.checkpoint}")
+        
+        # Les réglages du point de reprise sont conservés pour ne pas changer
+        # de fonction d'évaluation en cours de route
+        resumed = tuner.get_state()
+        for name in CHECKPOINT_SETTINGS:
+            if requested[name] != resumed[name]:
+                print(f"attention : {name} = {requested[name]} ignoré, le point de reprise "
+                      f"utilise {resumed[name]}", file=sys.stderr)
+    
+    best_weights = tuner.run(args.generations)
+    save_json(args.output, best_weights)
+    if tuner.best_fitness is None:
+        # Aucune génération évaluée (par exemple -g 0) : paramètres par défaut
+        print(f"aucune génération évaluée, paramètres par défaut écrits dans {args.output}")
+    else:
+        print(f"meilleurs paramètres ({tuner.best_fitness:.1f} lignes) écrits dans {args.output}")
@@ -12,19 +12,45 @@ import time
 import random
 import customtkinter as ctk
 from src.utils import get_rainbow_colors, format_time
+from src.pieces import PIECE_COLORS
+from src.profiler import profiler
+from src.renderer import CellRenderer, TileRenderer, PieceOverlay, create_tile
+
+# Nombre maximal de couleurs dans les caches des nuances et des tuiles
+SHADE_CACHE_SIZE = 256
+
+# Nombre de teintes de la palette arc-en-ciel (les tuiles de ces couleurs restent en cache)
+RAINBOW_STEPS = 36
+
+# Rendus des grilles de cellules disponibles : une image par cellule, ou six
+# éléments graphiques par cellule
+RENDERERS = {
+    "tiles": TileRenderer,
+    "items": CellRenderer,
+}
+
+# Délai sans nouvel événement de redimensionnement avant de recalculer la mise en page (ms)
+RESIZE_DELAY = 100
 
 class UI:
     """Interface utilisateur du jeu Tetris avec effets visuels améliorés"""
     
-    def __init__(self, root, game):
+    def __init__(self, root, game, renderer="tiles"):
         """Initialise l'interface utilisateur
         
         Args:
             root: Fenêtre principale CustomTkinter
             game: Instance du jeu
+            renderer: Rendu des grilles de cellules (clé de RENDERERS)
         """
         self.root = root
         self.game = game
+        self.renderer_class = RENDERERS[renderer]
+        
+        # Pièce du joueur humain dessinée à part et descendue en continu entre
+        # deux ticks (voir update_falling_piece)
+        self.smooth_fall = True
+        self.overlays = {}
         
         # Configuration du thème CustomTkinter
         ctk.set_appearance_mode("dark")  # Modes: "dark", "light"
@@ -33,6 +59,34 @@ class UI:
         # Taille initiale des cellules (réduite pour assurer la visibilité complète)
         self.cell_size = 16
         
+        # Affichage des mesures du profileur (créé à la demande, touche F3)
+        self.profiler_overlay = None
+        
+        # Rendu en mode retenu de chaque canvas de grille (créé au premier affichage)
+        self.renderers = {}
+        
+        # Nuances (claire, sombre, intérieure) de chaque couleur de cellule,
+        # précalculées pour les couleurs des pièces
+        self.shades = {}
+        for color in PIECE_COLORS.values():
+            self.get_shades(color)
+        
+        # Tuiles des cellules par couleur (TileRenderer), valables pour tile_size
+        self.tiles = {}
+        self.tile_size = None
+        
+        # Palette arc-en-ciel de l'affichage en cours (None hors mode arc-en-ciel)
+        self.rainbow_colors = None
+        self.rainbow_piece_color = None
+        
+        # Redimensionnement en attente (root.after) et taille des cellules de la
+        # mise en page actuelle des canvas
+        self.resize_job = None
+        self.layout_cell_size = None
+        
+        # Entrées (versions de l'état du jeu) de chaque widget lors de son dernier affichage
+        self.seen_versions = {}
+        
         # Configure la fenêtre principale
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
@@ -106,7 +160,7 @@ class UI:
             text_color=self.colors["text_title"]
         )
         self.subtitle_label.pack(pady=(0, 5))
-
+        
         # Section du joueur humain avec coins arrondis
         self.human_section = self.create_3d_frame(
             self.main_frame, 
@@ -453,7 +507,11 @@ class UI:
         setattr(self, attr_name, indicator)
     
     def calculate_cell_size(self):
-        """Calcule la taille optimale des cellules en fonction de l'espace disponible"""
+        """Calcule la taille optimale des cellules en fonction de l'espace disponible
+        
+        Returns:
+            bool: True si la taille a changé (canvas redimensionnés)
+        """
         # Mettre à jour la fenêtre pour obtenir les dimensions actuelles
         self.root.update_idletasks()
         
@@ -474,13 +532,21 @@ class UI:
         new_cell_size = min(max_cell_width, max_cell_height) * 0.95
         
         # Limiter la taille minimale et maximale (taille max réduite pour assurer la visibilité)
-        self.cell_size = min(max(10, new_cell_size), 22)
+        # Taille entière : la mise en page ne change pas à chaque pixel de redimensionnement
+        self.cell_size = int(min(max(10, new_cell_size), 22))
+        
+        # Rien à refaire si la taille n'a pas changé
+        if self.cell_size == self.layout_cell_size:
+            return False
         
         # Mettre à jour les dimensions des canvas
         self.update_canvas_sizes()
+        return True
     
     def update_canvas_sizes(self):
         """Met à jour les dimensions des canvas en fonction de la taille des cellules"""
+        self.layout_cell_size = self.cell_size
+        
         # Plateaux de jeu
         board_width = self.cell_size * self.game.human_board.width
         board_height = self.cell_size * self.game.human_board.height
@@ -492,159 +558,323 @@ class UI:
         next_piece_size = self.cell_size * 4
         self.human_next_canvas.config(width=next_piece_size, height=next_piece_size)
         self.ai_next_canvas.config(width=next_piece_size, height=next_piece_size)
+        
+        # Les éléments fixes dépendent de la taille des cellules
+        self.build_static_layers()
+    
+    def build_static_layers(self):
+        """Dessine les éléments fixes des canvas (grilles et bordures)
+        
+        Ces éléments ne changent qu'avec la taille des cellules : ils sont
+        recréés à chaque redimensionnement et conservés entre les affichages,
+        sous les cellules dessinées à chaque mise à jour.
+        """
+        columns, rows = self.game.human_board.width, self.game.human_board.height
+        for canvas in (self.human_canvas, self.ai_canvas):
+            self.draw_static_layer(canvas, columns, rows, self.colors["accent"], grid=True)
+        
+        for canvas in (self.human_next_canvas, self.ai_next_canvas):
+            self.draw_static_layer(canvas, 4, 4, self.colors["grid_line"], grid=False)
+    
+    def draw_static_layer(self, canvas, columns, rows, outline, grid):
+        """Dessine les éléments fixes d'un canvas (étiquette "static")
+        
+        Args:
+            canvas: Canvas à dessiner
+            columns: Nombre de colonnes de la grille
+            rows: Nombre de lignes de la grille
+            outline: Couleur de la bordure
+            grid: Si True, dessine aussi les lignes de la grille
+        """
+        canvas.delete("static")
+        width = columns * self.cell_size
+        height = rows * self.cell_size
+        
+        # Dessine les lignes de la grille
+        if grid:
+            for x in range(columns + 1):
+                canvas.create_line(
+                    x * self.cell_size, 0, x * self.cell_size, height,
+                    fill=self.colors["grid_line"], width=1, tags="static"
+                )
+            
+            for y in range(rows + 1):
+                canvas.create_line(
+                    0, y * self.cell_size, width, y * self.cell_size,
+                    fill=self.colors["grid_line"], width=1, tags="static"
+                )
+        
+        # Dessine une bordure autour du canvas pour mieux le délimiter
+        canvas.create_rectangle(0, 0, width, height, outline=outline, width=1, tags="static")
+        
+        # Les cellules restent au-dessus des éléments fixes
+        canvas.tag_lower("static")
     
     def on_resize(self, event):
-        """Gère le redimensionnement de la fenêtre"""
+        """Gère le redimensionnement de la fenêtre
+        
+        Une rafale d'événements (fenêtre redimensionnée à la souris) est regroupée
+        en un seul recalcul, effectué après RESIZE_DELAY ms sans nouvel événement.
+        La boucle de jeu continue entre-temps.
+        """
         # Ne réagir qu'aux événements de redimensionnement de la fenêtre principale
         if event.widget == self.root:
-            # Recalculer la taille des cellules
-            self.calculate_cell_size()
-            
-            # Redessiner les éléments
+            if self.resize_job is not None:
+                self.root.after_cancel(self.resize_job)
+            self.resize_job = self.root.after(RESIZE_DELAY, self.apply_resize)
+    
+    def apply_resize(self):
+        """Recalcule la taille des cellules une fois le redimensionnement terminé"""
+        self.resize_job = None
+        
+        # Redessiner les éléments seulement si la taille des cellules a changé
+        if self.calculate_cell_size():
             self.update_display()
     
     def update_display(self):
         """Met à jour l'affichage du jeu"""
-        # Met à jour les scores
-        self.human_score_label.configure(text=f"Score: {self.game.human_score}")
-        self.ai_score_label.configure(text=f"Score: {self.game.ai_score}")
+        with profiler.timed("ui.update_display"):
+            # Palette arc-en-ciel commune aux deux plateaux et aux pièces suivantes
+            self.update_rainbow_palette()
+            
+            game = self.game
+            
+            # Entrées communes à tous les canvas de cellules
+            look = (self.cell_size, self.rainbow_colors, self.rainbow_piece_color)
+            
+            # Met à jour les scores
+            if self.is_stale("human_score", game.get_version("score", "human")):
+                self.human_score_label.configure(text=f"Score: {game.human_score}")
+            if self.is_stale("ai_score", game.get_version("score", "ai")):
+                self.ai_score_label.configure(text=f"Score: {game.ai_score}")
+            
+            # Met à jour les plateaux (avec chute continue, la pièce du joueur humain
+            # est dessinée à part et ne fait pas redessiner son plateau)
+            if self.smooth_fall:
+                if self.is_stale("human_board", game.get_version("board", "human"), look):
+                    with profiler.timed("ui.update_board"):
+                        self.update_board(self.human_canvas, game.human_board, None)
+                self.update_falling_piece(
+                    self.human_canvas, game.human_current_piece, game.get_fall_progress("human")
+                )
+            elif self.is_stale("human_board", game.get_version("board", "human"), game.get_version("piece", "human"), look):
+                with profiler.timed("ui.update_board"):
+                    self.update_board(self.human_canvas, game.human_board, game.human_current_piece)
+            if self.is_stale("ai_board", game.get_version("board", "ai"), game.get_version("piece", "ai"), look):
+                with profiler.timed("ui.update_board"):
+                    self.update_board(self.ai_canvas, game.ai_board, game.ai_current_piece)
+            
+            # Met à jour les pièces suivantes
+            if self.is_stale("human_next", game.get_version("next", "human"), look):
+                self.update_next_piece(self.human_next_canvas, game.human_next_piece)
+            if self.is_stale("ai_next", game.get_version("next", "ai"), look):
+                self.update_next_piece(self.ai_next_canvas, game.ai_next_piece)
+            
+            # Met à jour les indicateurs des règles spéciales
+            self.update_special_rules_indicators()
+        
+        # Met à jour les mesures du profileur si elles sont affichées
+        if self.profiler_overlay:
+            self.update_profiler_overlay()
+    
+    def is_stale(self, name, *inputs):
+        """Indique si les entrées d'un widget ont changé depuis son dernier affichage
         
-        # Met à jour les plateaux
-        self.update_board(self.human_canvas, self.game.human_board, self.game.human_current_piece)
-        self.update_board(self.ai_canvas, self.game.ai_board, self.game.ai_current_piece)
+        Les nouvelles entrées sont mémorisées : le widget doit être mis à jour
+        quand la méthode retourne True.
         
-        # Met à jour les pièces suivantes
-        self.update_next_piece(self.human_next_canvas, self.game.human_next_piece)
-        self.update_next_piece(self.ai_next_canvas, self.game.ai_next_piece)
+        Args:
+            name: Nom du widget
+            inputs: Valeurs dont dépend l'affichage du widget (versions, textes...)
         
-        # Met à jour les indicateurs des règles spéciales
-        self.update_special_rules_indicators()
+        Returns:
+            bool: True si le widget doit être mis à jour
+        """
+        if self.seen_versions.get(name) == inputs:
+            return False
+        self.seen_versions[name] = inputs
+        return True
+    
+    def toggle_profiler_overlay(self):
+        """Affiche ou masque les mesures du profileur par-dessus le jeu"""
+        if self.profiler_overlay:
+            self.profiler_overlay.destroy()
+            self.profiler_overlay = None
+            return
+        
+        self.profiler_overlay = tk.Label(
+            self.root,
+            font=("Courier", 9),
+            justify="left",
+            anchor="nw",
+            bg=self.colors["shadow"],
+            fg=self.colors["text_normal"]
+        )
+        self.profiler_overlay.place(x=10, y=10)
+        self.update_profiler_overlay()
+    
+    def update_profiler_overlay(self):
+        """Met à jour le texte des mesures du profileur"""
+        if not profiler.enabled:
+            text = "Profileur désactivé (lancer avec --profile)"
+        else:
+            text = "\n".join(profiler.get_summary_lines() + ["(temps en ms, F3 pour masquer)"])
+        
+        # Statistiques de la boucle d'affichage (jeu en temps réel seulement)
+        if hasattr(self.game, "get_frame_stats"):
+            stats = self.game.get_frame_stats()
+            text += (
+                f"\n{stats['fps']:.0f}/{stats['target_fps']} images/s, {stats['skipped']} sautées, "
+                f"{stats['mean_ms']:.2f} ms en moyenne, {stats['max_ms']:.2f} ms au maximum"
+            )
+        self.profiler_overlay.configure(text=text)
+    
+    def update_rainbow_palette(self):
+        """Calcule les couleurs arc-en-ciel une seule fois pour tout l'affichage"""
+        if self.game.rainbow_mode:
+            self.rainbow_colors = get_rainbow_colors(steps=RAINBOW_STEPS)
+            self.rainbow_piece_color = self.rainbow_colors[int(time.time() * 5) % len(self.rainbow_colors)]
+        else:
+            self.rainbow_colors = None
+            self.rainbow_piece_color = None
+    
+    def get_shades(self, color):
+        """Retourne les nuances d'une couleur de cellule (calculées au premier appel)
+        
+        Args:
+            color: Couleur de base au format hexadécimal (#RRGGBB)
+        
+        Returns:
+            tuple: Couleurs claire (bords haut et gauche), sombre (bords bas et
+            droite) et intérieure
+        """
+        shades = self.shades.get(color)
+        if shades is None:
+            # Les couleurs arc-en-ciel changent à chaque affichage : le cache est
+            # vidé s'il grossit trop, puis les couleurs des pièces sont recalculées
+            if len(self.shades) >= SHADE_CACHE_SIZE:
+                self.shades = {}
+                for piece_color in PIECE_COLORS.values():
+                    self.get_shades(piece_color)
+            
+            shades = self.shades[color] = (
+                self.lighten_color(color),
+                self.darken_color(color),
+                self.lighten_color(color, amount=0.1),
+            )
+        return shades
+    
+    def get_tile(self, color):
+        """Retourne la tuile d'une couleur à la taille de cellule actuelle
+        
+        Les tuiles sont créées à la demande et recréées seulement quand la
+        taille des cellules change.
+        
+        Args:
+            color: Couleur de base au format hexadécimal (#RRGGBB)
+        
+        Returns:
+            tk.PhotoImage: Tuile de la cellule
+        """
+        if self.tile_size != self.cell_size:
+            self.tiles = {}
+            self.tile_size = self.cell_size
+        
+        tile = self.tiles.get(color)
+        if tile is None:
+            # Comme pour les nuances, le cache ne doit pas grossir indéfiniment :
+            # il est vidé puis les tuiles des couleurs des pièces sont recréées
+            # (les cellules affichées gardent leur tuile)
+            if len(self.tiles) >= SHADE_CACHE_SIZE:
+                self.tiles = {}
+                for piece_color in PIECE_COLORS.values():
+                    self.get_tile(piece_color)
+            
+            tile = self.tiles[color] = create_tile(self.root, self.cell_size, color, self.get_shades(color))
+        return tile
+    
+    def get_renderer(self, canvas, columns, rows):
+        """Retourne le rendu en mode retenu associé à un canvas (créé au premier appel)
+        
+        Args:
+            canvas: Canvas à dessiner
+            columns: Nombre de colonnes de la grille
+            rows: Nombre de lignes de la grille
+        
+        Returns:
+            CellRenderer: Rendu du canvas (de la classe renderer_class)
+        """
+        renderer = self.renderers.get(canvas)
+        if renderer is None:
+            renderer = self.renderers[canvas] = self.renderer_class(canvas, columns, rows, self)
+        return renderer
     
     def update_board(self, canvas, board, current_piece):
         """Met à jour l'affichage d'un plateau de jeu
         
+        Les cellules sont dessinées en mode retenu : seules celles dont la
+        couleur a changé depuis le dernier affichage sont reconfigurées.
+        
         Args:
             canvas: Canvas à mettre à jour
             board: Plateau de jeu à afficher
             current_piece: Pièce en cours de chute
         """
-        # Efface le canvas
-        canvas.delete("all")
-        
-        # Dessine la grille du plateau
-        for y in range(board.height):
-            for x in range(board.width):
-                # Récupère la couleur de la cellule
-                cell_value = board.grid[y][x]
-                
-                if cell_value:
-                    # Cellule occupée par une pièce
-                    color = cell_value
-                    
+        rainbow_colors = self.rainbow_colors
+        
+        # Couleur de chaque cellule du plateau
+        colors = []
+        for y, grid_row in enumerate(board.grid):
+            for x, cell_value in enumerate(grid_row):
+                if not cell_value:
+                    colors.append(None)
+                elif rainbow_colors:
                     # Applique l'effet arc-en-ciel si actif
-                    if self.game.rainbow_mode:
-                        rainbow_colors = get_rainbow_colors()
-                        color = rainbow_colors[(x + y) % len(rainbow_colors)]
-                    
-                    # Dessine la cellule
-                    self.draw_cell(canvas, x, y, color)
-        
-        # Dessine la pièce en cours de chute
+                    colors.append(rainbow_colors[(x + y) % len(rainbow_colors)])
+                else:
+                    colors.append(cell_value)
+        
+        # Ajoute la pièce en cours de chute
         if current_piece:
-            shape = current_piece.get_shape()
             color = current_piece.color
             
             # Applique l'effet arc-en-ciel si actif
-            if self.game.rainbow_mode:
-                rainbow_colors = get_rainbow_colors()
-                color = rainbow_colors[int(time.time() * 5) % len(rainbow_colors)]
+            if rainbow_colors:
+                color = self.rainbow_piece_color
             
-            for y_offset, row in enumerate(shape):
-                for x_offset, cell in enumerate(row):
-                    if cell:
-                        x = current_piece.x + x_offset
-                        y = current_piece.y + y_offset
-                        
-                        # Vérifie si la cellule est dans les limites du plateau
-                        if 0 <= x < board.width and 0 <= y < board.height:
-                            self.draw_cell(canvas, x, y, color)
-        
-        # Dessine les lignes de la grille
-        for x in range(board.width + 1):
-            canvas.create_line(
-                x * self.cell_size, 0, 
-                x * self.cell_size, board.height * self.cell_size, 
-                fill=self.colors["grid_line"], width=1
-            )
+            for x_offset, y_offset in current_piece.get_rotation_info().cells:
+                x = current_piece.x + x_offset
+                y = current_piece.y + y_offset
+                
+                # Vérifie si la cellule est dans les limites du plateau
+                if 0 <= x < board.width and 0 <= y < board.height:
+                    colors[y * board.width + x] = color
         
-        for y in range(board.height + 1):
-            canvas.create_line(
-                0, y * self.cell_size, 
-                board.width * self.cell_size, y * self.cell_size, 
-                fill=self.colors["grid_line"], width=1
-            )
-            
-        # Dessine une bordure autour du plateau pour mieux le délimiter
-        canvas.create_rectangle(
-            0, 0, 
-            board.width * self.cell_size, 
-            board.height * self.cell_size,
-            outline=self.colors["accent"], width=1
-        )
+        self.get_renderer(canvas, board.width, board.height).render(colors)
     
-    def draw_cell(self, canvas, x, y, color):
-        """Dessine une cellule sur un canvas avec effet 3D
+    def update_falling_piece(self, canvas, piece, progress):
+        """Dessine la pièce en chute par-dessus un plateau, entre deux lignes
         
         Args:
-            canvas: Canvas sur lequel dessiner
-            x: Position x de la cellule
-            y: Position y de la cellule
-            color: Couleur de la cellule
+            canvas: Canvas du plateau
+            piece: Pièce en cours de chute
+            progress: Avancement vers la ligne suivante (fraction de cellule)
         """
-        # Calcule les coordonnées
-        x1 = x * self.cell_size + 1
-        y1 = y * self.cell_size + 1
-        x2 = (x + 1) * self.cell_size - 1
-        y2 = (y + 1) * self.cell_size - 1
-        
-        # Dessine le rectangle principal
-        canvas.create_rectangle(
-            x1, y1, x2, y2,
-            fill=color, outline=""
-        )
+        overlay = self.overlays.get(canvas)
+        if overlay is None:
+            overlay = self.overlays[canvas] = PieceOverlay(canvas, self)
         
-        # Effet 3D simplifié adapté à des cellules plus petites
-        border_width = max(1, int(self.cell_size * 0.08))  # Bordure plus fine
+        if not piece:
+            overlay.hide()
+            return
         
-        # Bord clair (haut et gauche) - effet 3D
-        canvas.create_line(
-            x1, y1, x2, y1,
-            fill=self.lighten_color(color), width=border_width
-        )
-        canvas.create_line(
-            x1, y1, x1, y2,
-            fill=self.lighten_color(color), width=border_width
-        )
+        # Applique l'effet arc-en-ciel si actif
+        color = self.rainbow_piece_color if self.rainbow_colors else piece.color
         
-        # Bord sombre (bas et droite) - effet 3D
-        canvas.create_line(
-            x1, y2, x2, y2,
-            fill=self.darken_color(color), width=border_width
+        overlay.render(
+            piece.get_rotation_info().cells, color,
+            int(piece.x * self.cell_size), int((piece.y + progress) * self.cell_size)
         )
-        canvas.create_line(
-            x2, y1, x2, y2,
-            fill=self.darken_color(color), width=border_width
-        )
-        
-        # Effet de profondeur simplifié pour petites cellules
-        if self.cell_size > 14:  # Seulement pour les cellules assez grandes
-            padding = self.cell_size * 0.2
-            canvas.create_rectangle(
-                x1 + padding, y1 + padding,
-                x2 - padding, y2 - padding,
-                fill=self.lighten_color(color, amount=0.1),
-                outline=""
-            )
     
     def lighten_color(self, hex_color, amount=0.3):
         """Éclaircit une couleur hexadécimale
@@ -697,81 +927,105 @@ class UI:
             canvas: Canvas à mettre à jour
             next_piece: Pièce suivante à afficher
         """
-        # Efface le canvas
-        canvas.delete("all")
+        # Grille de 4 x 4 cellules, vide par défaut
+        colors = [None] * 16
         
         if next_piece:
-            shape = next_piece.get_shape()
+            info = next_piece.get_rotation_info()
             color = next_piece.color
             
             # Applique l'effet arc-en-ciel si actif
-            if self.game.rainbow_mode:
-                rainbow_colors = get_rainbow_colors()
-                color = rainbow_colors[int(time.time() * 5) % len(rainbow_colors)]
+            if self.rainbow_colors:
+                color = self.rainbow_piece_color
             
             # Détermine les dimensions de la forme
-            shape_width = len(shape[0])
-            shape_height = len(shape)
+            shape_width = len(info.shape[0])
+            shape_height = len(info.shape)
             
             # Détermine la position pour centrer la forme
             center_x = (4 - shape_width) // 2
             center_y = (4 - shape_height) // 2
             
-            # Dessine la pièce
-            for y, row in enumerate(shape):
-                for x, cell in enumerate(row):
-                    if cell:
-                        # Dessine la cellule centrée
-                        self.draw_cell(canvas, center_x + x, center_y + y, color)
-            
-            # Dessine une fine bordure autour du canvas
-            canvas.create_rectangle(
-                0, 0, canvas.winfo_reqwidth(), canvas.winfo_reqheight(),
-                outline=self.colors["grid_line"], width=1
-            )
+            # Place la pièce centrée (les formes 5 x 5 débordent comme auparavant)
+            for x, y in info.cells:
+                x += center_x
+                y += center_y
+                if 0 <= x < 4 and 0 <= y < 4:
+                    colors[y * 4 + x] = color
+        
+        self.get_renderer(canvas, 4, 4).render(colors)
     
     def update_special_rules_indicators(self):
-        """Met à jour les indicateurs des règles spéciales"""
+        """Met à jour les indicateurs des règles spéciales
+        
+        Les comptes à rebours sont recalculés à chaque affichage (et l'indicateur
+        reconfiguré si son texte a changé) ; les autres textes ne dépendent que
+        de l'état des règles et des scores, et ne sont recalculés que si leurs
+        versions ont changé.
+        """
+        game = self.game
+        rules_version = game.get_version("rules")
+        points_inputs = (rules_version, game.get_version("score", "human"), game.get_version("score", "ai"))
+        
         # Arc-en-ciel
         if self.game.rainbow_mode:
-            remaining_time = max(0, self.game.rainbow_end_time - time.time())
-            self.rainbow_indicator.configure(
-                text=f"Arc-en-ciel: Actif ({remaining_time:.1f}s)",
-                text_color=self.colors["highlight"]
+            remaining_time = max(0, self.game.rainbow_end_time - self.game.clock())
+            self.set_indicator(
+                "rainbow_indicator",
+                f"Arc-en-ciel: Actif ({remaining_time:.1f}s)",
+                self.colors["highlight"]
             )
         else:
-            next_rainbow = max(0, 120 - (time.time() - self.game.last_rainbow_time))
-            self.rainbow_indicator.configure(
-                text=f"Arc-en-ciel: {format_time(next_rainbow)}",
-                text_color=self.colors["text_normal"]
+            next_rainbow = max(0, 120 - (self.game.clock() - self.game.last_rainbow_time))
+            self.set_indicator(
+                "rainbow_indicator",
+                f"Arc-en-ciel: {format_time(next_rainbow)}",
+                self.colors["text_normal"]
             )
         
         # Pause douceur
         if self.game.pause_douceur_active["human"] or self.game.pause_douceur_active["ai"]:
-            remaining_time = max(0, max(self.game.pause_douceur_end_time.values()) - time.time())
-            self.pause_douceur_indicator.configure(
-                text=f"Pause douceur: Actif ({remaining_time:.1f}s)",
-                text_color=self.colors["highlight"]
+            remaining_time = max(0, max(self.game.pause_douceur_end_time.values()) - self.game.clock())
+            self.set_indicator(
+                "pause_douceur_indicator",
+                f"Pause douceur: Actif ({remaining_time:.1f}s)",
+                self.colors["highlight"]
             )
-        else:
+        elif self.is_stale("pause_douceur_points", *points_inputs):
             next_pause = max(0, 1000 - (self.game.human_score % 1000), 1000 - (self.game.ai_score % 1000))
-            self.pause_douceur_indicator.configure(
-                text=f"Pause douceur: Dans {next_pause} points",
-                text_color=self.colors["text_normal"]
+            self.set_indicator(
+                "pause_douceur_indicator",
+                f"Pause douceur: Dans {next_pause} points",
+                self.colors["text_normal"]
             )
         
         # Pièce rigolote
-        next_funny = max(0, 3000 - (self.game.human_score % 3000), 3000 - (self.game.ai_score % 3000))
-        self.piece_rigolote_indicator.configure(
-            text=f"Pièce rigolote: Dans {next_funny} points",
-            text_color=self.colors["text_normal"]
-        )
+        if self.is_stale("piece_rigolote_points", *points_inputs):
+            next_funny = max(0, 3000 - (self.game.human_score % 3000), 3000 - (self.game.ai_score % 3000))
+            self.set_indicator(
+                "piece_rigolote_indicator",
+                f"Pièce rigolote: Dans {next_funny} points",
+                self.colors["text_normal"]
+            )
         
         # Cadeau surprise
-        self.cadeau_indicator.configure(
-            text=f"Cadeau surprise: 2 lignes = cadeau",
-            text_color=self.colors["text_normal"]
-        )
+        if self.is_stale("cadeau", rules_version):
+            self.set_indicator(
+                "cadeau_indicator",
+                f"Cadeau surprise: 2 lignes = cadeau",
+                self.colors["text_normal"]
+            )
+    
+    def set_indicator(self, attr_name, text, text_color):
+        """Change le texte d'un indicateur seulement s'il est différent de celui affiché
+        
+        Args:
+            attr_name: Nom de l'attribut de l'indicateur
+            text: Texte à afficher
+            text_color: Couleur du texte
+        """
+        if self.is_stale(attr_name, text, text_color):
+            getattr(self, attr_name).configure(text=text, text_color=text_color)
     
     def show_game_over(self, winner):
         """Affiche l'écran de fin de partie avec effet 3D
@@ -54,11 +54,13 @@ def hsv_to_rgb(h, s, v):
     
     return r, g, b
 
-def get_rainbow_colors(time_offset=0):
+def get_rainbow_colors(time_offset=0, steps=None):
     """Génère des couleurs arc-en-ciel en fonction du temps
     
     Args:
         time_offset: Décalage temporel en secondes
+        steps: Nombre de teintes possibles sur le cercle chromatique (optionnel) ;
+               les teintes sont arrondies pour que les couleurs restent en nombre fini
     
     Returns:
         list: Liste de codes couleur au format hexadécimal
@@ -67,6 +69,8 @@ def get_rainbow_colors(time_offset=0):
     t = time.time() + time_offset
     for i in range(7):
         hue = (t * 50 + i * 50) % 360
+        if steps:
+            hue = round(hue * steps / 360) % steps * 360 / steps
         r, g, b = hsv_to_rgb(hue, 0.8, 0.9)
         colors.append(f"#{r:02x}{g:02x}{b:02x}")
     